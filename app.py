@@ -7,9 +7,14 @@ if __name__ == "__main__":
 
 import argparse
 import gc
+import os
+import sys
 import uvicorn
 from scripts.config import Services
 
+# uvloop is not available on Windows
+EVENT_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
 gc.collect()
 
 ap = argparse.ArgumentParser()
@@ -17,6 +22,20 @@ ap = argparse.ArgumentParser()
 if __name__ == "__main__":
     ap.add_argument("--port", "-p", required=False, default=Services.PORT, help="Port to start the application.")
     ap.add_argument("--bind", "-b", required=False, default=Services.HOST, help="IP to start the application.")
+    ap.add_argument("--workers", "-w", required=False, type=int, default=Services.WORKERS,
+                    help="Worker processes, each with its own Mongo and Redis pools.")
     arguments = vars(ap.parse_args())
-    logger.info(f"App Starting at {arguments['bind']}:{arguments['port']}")
-    uvicorn.run("main:app", host=arguments["bind"], port=int(arguments["port"]))
+    logger.info(f"App Starting at {arguments['bind']}:{arguments['port']} with {arguments['workers']} worker(s)")
+    # Spawned workers read it from the environment, e.g. to log to their own file
+    os.environ["WORKERS"] = str(arguments["workers"])
+    uvicorn.run(
+        "main:app",
+        host=arguments["bind"],
+        port=int(arguments["port"]),
+        workers=arguments["workers"],
+        loop=EVENT_LOOP,
+        http="httptools",
+        # On shutdown in-flight requests get this long to finish before the
+        # lifespan flushes buffers and closes the pools
+        timeout_graceful_shutdown=Services.SHUTDOWN_TIMEOUT_SECS,
+    )
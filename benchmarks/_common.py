@@ -0,0 +1,93 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The benchmarks talk to a running instance of the service (`python app.py`)
+over HTTP, so they can be pointed at any checkout to compare before/after.
+"""
+
+import json
+import math
+
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+DEFAULT_BASE_URL = "http://127.0.0.1:6869"
+DEFAULT_USERNAME_PREFIX = "bench_user"
+DEFAULT_PASSWORD = "bench_password"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of the given values.
+    Args:
+        values: Samples to compute the percentile over.
+        pct: Percentile in the range 0-100.
+    Returns:
+        float: The percentile value, 0.0 if there are no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def summarise(latencies: List[float], elapsed: float, errors: int = 0) -> Dict:
+    """
+    Builds a throughput / latency summary from per-request latencies in seconds.
+    """
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def print_report(label: str, report: Dict) -> None:
+    print(json.dumps({"label": label, **report}, indent=2))
+
+
+async def login(
+    client: httpx.AsyncClient,
+    username: Optional[str] = None,
+    password: str = DEFAULT_PASSWORD,
+    user_role: str = "admin",
+) -> Tuple[str, str]:
+    """
+    Signs up a fresh benchmark user and logs in with it.
+    Args:
+        client: Client bound to the service base url.
+        username: Username to register, a unique one is generated by default.
+        password: Password to register and log in with.
+        user_role: Role of the benchmark user, admins see every task.
+    Returns:
+        Tuple[str, str]: The login token and the user_id of the benchmark user.
+    """
+    username = username or f"{DEFAULT_USERNAME_PREFIX}_{uuid.uuid4().hex[:8]}"
+    sign_up = await client.post(
+        f"{Endpoints.api_auth}{Endpoints.api_sign_up}",
+        json={
+            "username": username,
+            "password": password,
+            "email": f"{username}@bench.example.com",
+            "user_role": user_role,
+        },
+    )
+    user_id = sign_up.json().get("data") or ""
+    response = await client.post(
+        f"{Endpoints.api_auth}{Endpoints.api_login}",
+        json={"username": username, "password": password},
+    )
+    token = response.headers.get(Secrets.access_token)
+    if not token:
+        raise RuntimeError(f"Login failed: {response.text}")
+    return token, user_id
@@ -0,0 +1,122 @@
+"""
+Bulk task write benchmark.
+
+Creates the same number of tasks through the single-item /task/create route
+(with a pool of concurrent clients) and through /task/bulk_create, then
+updates them through /task/update and /task/bulk_update, and reports
+tasks/sec for each path:
+
+    python -m benchmarks.bulk_tasks --tasks 5000 --batch-size 1000 --clients 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks._common import DEFAULT_BASE_URL, login
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+
+def make_task(user_id: str, index: int, task_id: str = "") -> dict:
+    return {
+        "task_id": task_id,
+        "title": f"Bench task {index}",
+        "description": "Created by the bulk write benchmark",
+        "assigned_to": user_id,
+        "meta": None,
+        "due_date": int(time.time()) + index,
+        "comments": "",
+        "status": "Open",
+    }
+
+
+async def _single(client, headers, path, tasks, clients):
+    queue = asyncio.Queue()
+    for task in tasks:
+        queue.put_nowait(task)
+    task_ids = []
+
+    async def worker():
+        while not queue.empty():
+            task = queue.get_nowait()
+            response = await client.post(path, json=task, headers=headers)
+            task_ids.append(response.json().get("data"))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    return time.perf_counter() - start, task_ids
+
+
+async def _bulk(client, headers, path, tasks, batch_size):
+    task_ids = []
+    start = time.perf_counter()
+    for offset in range(0, len(tasks), batch_size):
+        response = await client.post(
+            path, json=tasks[offset: offset + batch_size], headers=headers
+        )
+        task_ids.extend(item["task_id"] for item in response.json().get("data") or [])
+    return time.perf_counter() - start, task_ids
+
+
+def _rate(count, elapsed):
+    return round(count / elapsed, 2) if elapsed else 0.0
+
+
+async def run(base_url, count, batch_size, clients):
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+        token, user_id = await login(client)
+        headers = {Secrets.access_token: token}
+        tasks = [make_task(user_id, index) for index in range(count)]
+        task_path = Endpoints.api_task
+
+        single_create, single_ids = await _single(
+            client, headers, f"{task_path}{Endpoints.api_create}", tasks, clients
+        )
+        bulk_create, bulk_ids = await _bulk(
+            client, headers, f"{task_path}{Endpoints.api_bulk_create}", tasks, batch_size
+        )
+        single_update, _ = await _single(
+            client,
+            headers,
+            f"{task_path}{Endpoints.api_update}",
+            [make_task(user_id, i, task_id) for i, task_id in enumerate(single_ids)],
+            clients,
+        )
+        bulk_update, _ = await _bulk(
+            client,
+            headers,
+            f"{task_path}{Endpoints.api_bulk_update}",
+            [make_task(user_id, i, task_id) for i, task_id in enumerate(bulk_ids)],
+            batch_size,
+        )
+    return {
+        "create": {
+            "single_tps": _rate(count, single_create),
+            "bulk_tps": _rate(count, bulk_create),
+            "speedup": round(single_create / bulk_create, 2) if bulk_create else 0.0,
+        },
+        "update": {
+            "single_tps": _rate(count, single_update),
+            "bulk_tps": _rate(count, bulk_update),
+            "speedup": round(single_update / bulk_update, 2) if bulk_update else 0.0,
+        },
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--tasks", type=int, default=5000)
+    ap.add_argument("--batch-size", type=int, default=1000)
+    ap.add_argument("--clients", type=int, default=20)
+    args = ap.parse_args()
+    report = asyncio.run(run(args.base_url, args.tasks, args.batch_size, args.clients))
+    for operation, result in report.items():
+        print(f"{operation:>6}: {result}")
+
+
+if __name__ == "__main__":
+    main()
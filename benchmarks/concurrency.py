@@ -0,0 +1,168 @@
+"""
+Concurrency benchmark for the task fetch route.
+
+Runs a fixed number of concurrent clients against /task/fetch for a fixed
+duration and reports requests/sec and latency percentiles. Run it once
+against the previous build and once against the current one to compare:
+
+    python -m benchmarks.concurrency --clients 200 --duration 30 --label after
+
+With `--backend stub` the benchmark starts its own server on --base-url, with
+the in-process stand-ins of benchmarks.load_test seeded with --tasks tasks.
+The stand-ins answer without I/O, so --mongo-delay-ms adds a fixed awaited
+round trip to every Mongo call; a request then spends most of its time
+waiting on Mongo, as it does against a real server:
+
+    python -m benchmarks.concurrency --backend stub --mongo-delay-ms 5 --tasks 20
+"""
+
+import argparse
+import asyncio
+import functools
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from benchmarks._common import (
+    DEFAULT_BASE_URL,
+    login,
+    print_report,
+    summarise,
+)
+from benchmarks.load_test import install_stand_ins
+from benchmarks.seed import seed_tasks
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+
+async def _client_loop(client, token, payload, deadline, latencies, errors):
+    path = f"{Endpoints.api_task}{Endpoints.api_fetch}"
+    headers = {Secrets.access_token: token}
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post(path, json=payload, headers=headers)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+        except httpx.HTTPError:
+            errors.append(1)
+
+
+async def run(base_url: str, clients: int, duration: float) -> dict:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        token, user_id = await login(client)
+        payload = {"user_id": user_id, "filters": {"filterModel": {}, "sortModel": []}}
+        latencies, errors = [], []
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(
+            *(
+                _client_loop(client, token, payload, deadline, latencies, errors)
+                for _ in range(clients)
+            )
+        )
+        return summarise(latencies, time.perf_counter() - start, len(errors))
+
+
+def _delayed(method, delay: float):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return await method(*args, **kwargs)
+
+    return wrapper
+
+
+def _delay_stand_ins(delay: float) -> None:
+    from mongomock_motor import (
+        AsyncCursor,
+        AsyncLatentCommandCursor,
+        AsyncMongoMockCollection,
+    )
+
+    # Cursors pay the round trip when they are read, like motor's
+    for cls, names in (
+        (AsyncMongoMockCollection, ("find_one", "insert_one", "update_one")),
+        (AsyncCursor, ("to_list",)),
+        (AsyncLatentCommandCursor, ("to_list",)),
+    ):
+        for name in names:
+            setattr(cls, name, _delayed(getattr(cls, name), delay))
+
+
+def _serve_stub(base_url: str, tasks: int, delay_ms: float) -> None:
+    import uvicorn
+
+    install_stand_ins()
+    import main
+    from scripts.config.constants import CollectionMap, DBMapping
+    from scripts.core.db.mongo import mongo_client
+
+    collection = mongo_client[DBMapping.task_manager][CollectionMap.tasks]
+    asyncio.run(seed_tasks(collection, tasks))
+    if delay_ms:
+        _delay_stand_ins(delay_ms / 1000)
+    address = urlsplit(base_url)
+    uvicorn.run(main.app, host=address.hostname, port=address.port, log_level="warning")
+
+
+def _start_stub(args) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.concurrency",
+            "--stub-server",
+            "--base-url",
+            args.base_url,
+            "--tasks",
+            str(args.tasks),
+            "--mongo-delay-ms",
+            str(args.mongo_delay_ms),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.perf_counter() + 60
+    while time.perf_counter() < deadline:
+        try:
+            httpx.get(f"{args.base_url}/", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError(f"Stub server at {args.base_url} did not start")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--clients", type=int, default=200)
+    ap.add_argument("--duration", type=float, default=30)
+    ap.add_argument("--label", default="run")
+    ap.add_argument("--backend", choices=("http", "stub"), default="http")
+    ap.add_argument("--tasks", type=int, default=100, help="Tasks seeded by stub")
+    ap.add_argument("--mongo-delay-ms", type=float, default=0)
+    ap.add_argument("--stub-server", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.stub_server:
+        _serve_stub(args.base_url, args.tasks, args.mongo_delay_ms)
+        return
+    server = _start_stub(args) if args.backend == "stub" else None
+    try:
+        report = asyncio.run(run(args.base_url, args.clients, args.duration))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    print_report(args.label, {"clients": args.clients, **report})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Conditional polling benchmark for the task fetch route.
+
+Polls /task/fetch repeatedly while nothing changes, once sending back the
+ETag of the previous response as If-None-Match and once without it, and
+reports latency percentiles and the response bytes of each mode:
+
+    python -m benchmarks.etag_polling --tasks 2000 --polls 500
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks._common import DEFAULT_BASE_URL, login, print_report, summarise
+from benchmarks.bulk_tasks import make_task
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+
+async def _seed(client, headers, user_id, count):
+    path = f"{Endpoints.api_task}{Endpoints.api_bulk_create}"
+    tasks = [make_task(user_id, index) for index in range(count)]
+    response = await client.post(path, json=tasks, headers=headers)
+    response.raise_for_status()
+
+
+async def _poll(client, headers, payload, polls, conditional):
+    path = f"{Endpoints.api_task}{Endpoints.api_fetch}"
+    etag, latencies, body_bytes, not_modified = None, [], 0, 0
+    start = time.perf_counter()
+    for _ in range(polls):
+        request_headers = dict(headers)
+        if conditional and etag:
+            request_headers["If-None-Match"] = etag
+        began = time.perf_counter()
+        response = await client.post(path, json=payload, headers=request_headers)
+        latencies.append(time.perf_counter() - began)
+        body_bytes += len(response.content)
+        not_modified += response.status_code == 304
+        etag = response.headers.get("ETag", etag)
+    report = summarise(latencies, time.perf_counter() - start)
+    report["body_bytes_total"] = body_bytes
+    report["body_bytes_per_poll"] = round(body_bytes / polls, 1) if polls else 0
+    report["not_modified"] = not_modified
+    return report
+
+
+async def run(base_url: str, tasks: int, polls: int) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        token, user_id = await login(client, user_role="user")
+        headers = {Secrets.access_token: token}
+        if tasks:
+            await _seed(client, headers, user_id, tasks)
+        payload = {"user_id": user_id, "filters": {"filterModel": {}, "sortModel": []}}
+        full = await _poll(client, headers, payload, polls, conditional=False)
+        conditional = await _poll(client, headers, payload, polls, conditional=True)
+        return {
+            "tasks": tasks,
+            "unconditional": full,
+            "if_none_match": conditional,
+            "bytes_saved": full["body_bytes_total"] - conditional["body_bytes_total"],
+        }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--tasks", type=int, default=2000, help="Tasks assigned to the poller")
+    ap.add_argument("--polls", type=int, default=500)
+    ap.add_argument("--label", default="etag")
+    args = ap.parse_args()
+    print_report(args.label, asyncio.run(run(args.base_url, args.tasks, args.polls)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+End-to-end load test of the real `main:app`, driven in-process.
+
+Requests go through httpx's ASGI transport straight into the application, with
+its lifespan running, so no server process is needed. Mongo and Redis are
+either in-process stand-ins (mongomock-motor and fakeredis, installed with
+`pip install mongomock-motor fakeredis lupa`) or the configured
+MONGO_URI / REDIS_URI, e.g. local containers. mongomock copies every document
+a query scans, in Python, so stub runs suit the small sizes; the 10k/100k/1m
+datasets are meant for the local backend:
+
+    python -m benchmarks.load_test --backend stub --size 1k --duration 20
+    python -m benchmarks.load_test --backend local --size 100k --mix grid_polling
+
+Traffic mixes split the clients between login storms, AG-Grid polling with the
+benchmarks.query_builder filter/sort models (reusing the ETag like a grid does)
+and bulk task creation. Throughput and p50/p95/p99 are reported per route and
+written as JSON; with --baseline the run fails when a route's p95 grows, or its
+throughput drops, by more than --threshold:
+
+    python -m benchmarks.load_test --output baseline.json
+    python -m benchmarks.load_test --baseline baseline.json --threshold 0.2
+
+The client shares the event loop with the app, so compare runs on the same
+machine and backend rather than reading the numbers as server capacity.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+from collections import defaultdict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, List
+
+import httpx
+
+from benchmarks._common import DEFAULT_PASSWORD, login, summarise
+from benchmarks.bulk_tasks import make_task
+from benchmarks.query_builder import FILTER_MODELS
+from benchmarks.seed import SIZES, seed_tasks
+from scripts.api import Endpoints
+from scripts.config.constants import QueryConstants, Secrets
+
+LOGIN_PATH = f"{Endpoints.api_auth}{Endpoints.api_login}"
+FETCH_PATH = f"{Endpoints.api_task}{Endpoints.api_fetch}"
+BULK_CREATE_PATH = f"{Endpoints.api_task}{Endpoints.api_bulk_create}"
+
+# Share of the clients running each traffic kind.
+MIXES = {
+    "login_storm": {"login": 0.8, "poll": 0.2},
+    "grid_polling": {"poll": 1.0},
+    "bulk_create": {"bulk_create": 0.5, "poll": 0.5},
+    "mixed": {"poll": 0.7, "login": 0.2, "bulk_create": 0.1},
+}
+COMPARED = (("p95_ms", 1), ("rps", -1))
+
+
+class Recorder:
+    """
+    Per-route latencies and error counts of one mix.
+    """
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, route: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await client.post(route, **kwargs)
+        except httpx.HTTPError:
+            self.errors[route] += 1
+            return None
+        if response.status_code >= 400:
+            self.errors[route] += 1
+            return response
+        self.latencies[route].append(time.perf_counter() - start)
+        return response
+
+    def report(self, elapsed: float) -> Dict:
+        return {
+            route: summarise(self.latencies[route], elapsed, self.errors[route])
+            for route in sorted(set(self.latencies) | set(self.errors))
+        }
+
+
+def install_stand_ins() -> None:
+    """
+    Points the app's Mongo and Redis clients at in-process stand-ins. Has to
+    run before the lifespan opens the real clients.
+    """
+    try:
+        from fakeredis import FakeAsyncRedis
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError as e:
+        raise SystemExit(
+            "--backend stub needs: pip install mongomock-motor fakeredis lupa"
+        ) from e
+    import scripts.core.db.mongo as mongo_db
+    import scripts.core.db.redis as redis_db
+
+    mongo_db.mongo_client.factory = AsyncMongoMockClient
+    redis_db.login_db.factory = lambda: FakeAsyncRedis(decode_responses=True)
+
+
+async def _seed(count: int) -> None:
+    from scripts.config.constants import CollectionMap, DBMapping
+    from scripts.core.db.mongo import mongo_client
+
+    collection = mongo_client[DBMapping.task_manager][CollectionMap.tasks]
+    await collection.delete_many({})
+    await seed_tasks(collection, count)
+
+
+async def _login_client(client, recorder, usernames, deadline, rng):
+    while time.perf_counter() < deadline:
+        payload = {"username": rng.choice(usernames), "password": DEFAULT_PASSWORD}
+        await recorder.request(client, LOGIN_PATH, json=payload)
+
+
+async def _poll_client(client, recorder, user, deadline, rng, page_size):
+    token, user_id = user
+    etags = {}
+    while time.perf_counter() < deadline:
+        model = rng.choice(list(FILTER_MODELS))
+        headers = {Secrets.access_token: token}
+        if model in etags:
+            headers[QueryConstants.if_none_match_header] = etags[model]
+        payload = {
+            "user_id": user_id,
+            "filters": FILTER_MODELS[model],
+            "page_size": page_size,
+        }
+        response = await recorder.request(
+            client, FETCH_PATH, json=payload, headers=headers
+        )
+        if response is not None and response.status_code == 200:
+            etags[model] = response.headers.get(QueryConstants.etag_header)
+
+
+async def _bulk_create_client(client, recorder, user, deadline, batch_size):
+    token, user_id = user
+    headers = {Secrets.access_token: token}
+    counter = itertools.count()
+    while time.perf_counter() < deadline:
+        batch = [make_task(user_id, next(counter)) for _ in range(batch_size)]
+        await recorder.request(client, BULK_CREATE_PATH, json=batch, headers=headers)
+
+
+def _split(weights: Dict[str, float], clients: int) -> Dict[str, int]:
+    return {kind: max(1, round(clients * share)) for kind, share in weights.items()}
+
+
+async def _run_mix(client, mix, users, usernames, args) -> Dict:
+    recorder, rng = Recorder(), random.Random(args.seed)
+    deadline = time.perf_counter() + args.duration
+    workers = []
+    for kind, count in _split(MIXES[mix], args.clients).items():
+        for index in range(count):
+            user = users[index % len(users)]
+            if kind == "login":
+                workers.append(_login_client(client, recorder, usernames, deadline, rng))
+            elif kind == "poll":
+                workers.append(
+                    _poll_client(client, recorder, user, deadline, rng, args.page_size)
+                )
+            else:
+                workers.append(
+                    _bulk_create_client(client, recorder, user, deadline, args.batch_size)
+                )
+    start = time.perf_counter()
+    await asyncio.gather(*workers)
+    return recorder.report(time.perf_counter() - start)
+
+
+async def run(args) -> Dict:
+    if args.backend == "stub":
+        install_stand_ins()
+    from main import app
+
+    report = {
+        "meta": {
+            "backend": args.backend,
+            "size": args.size,
+            "clients": args.clients,
+            "duration_s": args.duration,
+            "python": platform.python_version(),
+        },
+        "mixes": {},
+    }
+    async with app.router.lifespan_context(app):
+        if not args.skip_seed:
+            await _seed(SIZES[args.size])
+        transport = httpx.ASGITransport(app=app)
+        # No cookie jar: every client authenticates with its own token header,
+        # the login cookie of one simulated user must not leak to the others.
+        cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=120, cookies=cookies
+        ) as client:
+            users, usernames = [], []
+            for index in range(args.users):
+                username = f"load_{int(time.time())}_{index}"
+                users.append(await login(client, username=username))
+                usernames.append(username)
+            for mix in MIXES if args.mix == "all" else [args.mix]:
+                report["mixes"][mix] = await _run_mix(
+                    client, mix, users, usernames, args
+                )
+    return report
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Lists the routes whose p95 grew, or throughput dropped, by more than
+    `threshold` (a fraction) against the baseline run.
+    """
+    regressions = []
+    for mix, routes in report["mixes"].items():
+        for route, result in routes.items():
+            previous = baseline.get("mixes", {}).get(mix, {}).get(route)
+            if not previous:
+                continue
+            for field, direction in COMPARED:
+                before, after = previous[field], result[field]
+                if before and (after - before) * direction / before > threshold:
+                    regressions.append(f"{mix} {route} {field}: {before} -> {after}")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--backend", choices=("stub", "local"), default="stub")
+    ap.add_argument("--size", choices=SIZES, default="1k")
+    ap.add_argument("--skip-seed", action="store_true", help="Reuse existing tasks")
+    ap.add_argument("--mix", choices=("all", *MIXES), default="all")
+    ap.add_argument("--clients", type=int, default=20)
+    ap.add_argument("--users", type=int, default=5)
+    ap.add_argument("--duration", type=float, default=20, help="Seconds per mix")
+    ap.add_argument("--page-size", type=int, default=100)
+    ap.add_argument("--batch-size", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--output", help="Write the JSON report to this file")
+    ap.add_argument("--baseline", help="JSON report of a previous run to compare to")
+    ap.add_argument("--threshold", type=float, default=0.2)
+    args = ap.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    for mix, routes in report["mixes"].items():
+        for route, result in routes.items():
+            print(f"{mix:<13} {route:<18} {result['rps']:>9} req/s  "
+                  f"p50 {result['p50_ms']} p95 {result['p95_ms']} "
+                  f"p99 {result['p99_ms']} ms  errors {result['errors']}")
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("meta") != report["meta"]:
+            print(f"Baseline ran with different settings: {baseline.get('meta')}")
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Logging overhead benchmark: request throughput with logging off, with the
+previous synchronous handlers, and with the queue-based pipeline.
+
+Runs an in-process ASGI app whose route logs like a request on the hot path
+(one DEBUG line and one INFO line), so the numbers isolate logging cost from
+Mongo and Redis. Log output goes to temporary files; --write-delay-ms makes
+every write block for that long, like a slow or saturated disk would:
+
+    python -m benchmarks.logging_overhead --requests 20000 --clients 50
+    python -m benchmarks.logging_overhead --requests 2000 --write-delay-ms 1
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueListener
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks._common import summarise
+from scripts.logging import TEXT_FORMAT, NonBlockingQueueHandler
+
+MODES = ("off", "sync", "queue")
+
+
+class _SlowFileHandler(logging.FileHandler):
+    def __init__(self, filename: str, delay_s: float):
+        super().__init__(filename)
+        self.delay_s = delay_s
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if self.delay_s:
+            time.sleep(self.delay_s)
+
+
+def _logger(mode: str, directory: str, delay_s: float):
+    logger = logging.getLogger(f"bench_{mode}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG if mode != "off" else logging.CRITICAL)
+    formatter = logging.Formatter(TEXT_FORMAT)
+    handlers = []
+    for stream_name in ("console", "file"):
+        handler = _SlowFileHandler(
+            os.path.join(directory, f"{mode}_{stream_name}.log"), delay_s
+        )
+        handler.setFormatter(formatter)
+        handlers.append(handler)
+    if mode == "queue":
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(NonBlockingQueueHandler(log_queue, max_size=10000))
+        listener = QueueListener(log_queue, *handlers)
+        listener.start()
+        return logger, listener
+    for handler in handlers:
+        logger.addHandler(handler)
+    return logger, None
+
+
+def _app(logger: logging.Logger) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(user_id: str = "bench"):
+        logger.debug("Validated session of user %s", user_id)
+        logger.info("Fetched tasks for %s", user_id)
+        return {"status": "success"}
+
+    return app
+
+
+async def _run_mode(logger, requests: int, clients: int) -> dict:
+    transport = httpx.ASGITransport(app=_app(logger))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies, remaining = [], iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                await client.get("/ping")
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        return summarise(latencies, time.perf_counter() - start)
+
+
+def run(requests: int, clients: int, write_delay_ms: float) -> dict:
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in MODES:
+            logger, listener = _logger(mode, directory, write_delay_ms / 1000)
+            report[mode] = asyncio.run(_run_mode(logger, requests, clients))
+            if listener:
+                listener.stop()
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--requests", type=int, default=20000)
+    ap.add_argument("--clients", type=int, default=50)
+    ap.add_argument("--write-delay-ms", type=float, default=0)
+    args = ap.parse_args()
+    for mode, result in run(args.requests, args.clients, args.write_delay_ms).items():
+        print(f"{mode:<6} {result['rps']:>10} req/s  p99 {result['p99_ms']} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Login-storm benchmark.
+
+Measures /task/fetch latency twice: once on a quiet service and once while a
+pool of clients hammers /auth/login. With bcrypt on the event loop the p99 of
+the second phase explodes; with hashing on the worker pool it should stay
+close to the quiet baseline. Rejected logins (503) are counted separately.
+
+    python -m benchmarks.login_storm --pollers 20 --login-clients 50 --duration 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks._common import DEFAULT_BASE_URL, DEFAULT_PASSWORD, login, summarise
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+
+async def _poll_fetch(client, token, user_id, deadline, latencies, errors):
+    path = f"{Endpoints.api_task}{Endpoints.api_fetch}"
+    payload = {"user_id": user_id, "filters": {"filterModel": {}, "sortModel": []}}
+    headers = {Secrets.access_token: token}
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post(path, json=payload, headers=headers)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+        except httpx.HTTPError:
+            errors.append(1)
+
+
+async def _login_loop(client, username, deadline, counters):
+    path = f"{Endpoints.api_auth}{Endpoints.api_login}"
+    payload = {"username": username, "password": DEFAULT_PASSWORD}
+    while time.perf_counter() < deadline:
+        response = await client.post(path, json=payload)
+        key = "rejected" if response.status_code == 503 else "completed"
+        counters[key] += 1
+
+
+async def _phase(client, token, user_id, pollers, login_clients, username, duration):
+    latencies, errors = [], []
+    counters = {"completed": 0, "rejected": 0}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(
+        *(
+            _poll_fetch(client, token, user_id, deadline, latencies, errors)
+            for _ in range(pollers)
+        ),
+        *(
+            _login_loop(client, username, deadline, counters)
+            for _ in range(login_clients)
+        ),
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "fetch": summarise(latencies, elapsed, len(errors)),
+        "logins": {
+            **counters,
+            "rps": round(counters["completed"] / elapsed, 2),
+        },
+    }
+
+
+async def run(base_url, pollers, login_clients, duration):
+    limits = httpx.Limits(max_connections=pollers + login_clients + 1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        token, user_id = await login(client)
+        storm_user = f"storm_{int(time.time())}"
+        await login(client, username=storm_user)
+        quiet = await _phase(client, token, user_id, pollers, 0, storm_user, duration)
+        storm = await _phase(
+            client, token, user_id, pollers, login_clients, storm_user, duration
+        )
+        return {"quiet": quiet, "storm": storm}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--pollers", type=int, default=20)
+    ap.add_argument("--login-clients", type=int, default=50)
+    ap.add_argument("--duration", type=float, default=20)
+    args = ap.parse_args()
+    report = asyncio.run(
+        run(args.base_url, args.pollers, args.login_clients, args.duration)
+    )
+    for phase, result in report.items():
+        print(f"{phase:>6}: fetch p99={result['fetch']['p99_ms']}ms "
+              f"fetch rps={result['fetch']['rps']} logins={result['logins']}")
+
+
+if __name__ == "__main__":
+    main()
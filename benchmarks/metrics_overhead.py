@@ -0,0 +1,103 @@
+"""
+Metrics overhead benchmark.
+
+Measures the per-call cost of the hot-path recorders (histogram observe,
+counter inc, the pymongo command listener, an instrumented Redis call's
+bookkeeping) and the request throughput of an in-process ASGI app with the
+metrics middleware on and off:
+
+    python -m benchmarks.metrics_overhead --requests 20000 --clients 50
+"""
+
+import argparse
+import asyncio
+import time
+import timeit
+
+import httpx
+from fastapi import FastAPI
+from pymongo import monitoring
+
+from benchmarks._common import summarise
+from scripts.utils.metrics_util import (
+    MetricsMiddleware,
+    MongoCommandMetrics,
+    http_latency,
+    http_requests,
+    metrics,
+    observe_redis,
+)
+
+
+class _Succeeded:
+    """
+    Duck-typed CommandSucceededEvent carrying the fields the listener reads.
+    """
+
+    command_name = "aggregate"
+    duration_micros = 1500
+
+
+def _recorder_costs(number: int) -> dict:
+    listener: monitoring.CommandListener = MongoCommandMetrics()
+    event = _Succeeded()
+    started = time.perf_counter()
+    recorders = {
+        "histogram_observe": lambda: http_latency.observe(0.003, "POST", "/bench"),
+        "counter_inc": lambda: http_requests.inc("POST", "/bench", "200"),
+        "mongo_listener": lambda: listener.succeeded(event),
+        "redis_observe": lambda: observe_redis("GET", started),
+    }
+    return {
+        name: round(min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9)
+        for name, call in recorders.items()
+    }
+
+
+def _app(instrumented: bool):
+    app = FastAPI()
+
+    @app.post("/bench")
+    async def bench():
+        return {"status": "success"}
+
+    return MetricsMiddleware(app) if instrumented else app
+
+
+async def _throughput(instrumented: bool, requests: int, clients: int) -> dict:
+    transport = httpx.ASGITransport(app=_app(instrumented))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        latencies, remaining = [], iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                await client.post("/bench")
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        return summarise(latencies, time.perf_counter() - start)
+
+
+def run(requests: int, clients: int, number: int) -> dict:
+    metrics.enabled = True
+    report = {"recorder_ns_per_call": _recorder_costs(number)}
+    for label, instrumented in (("metrics_off", False), ("metrics_on", True)):
+        report[label] = asyncio.run(_throughput(instrumented, requests, clients))
+    off, on = report["metrics_off"]["rps"], report["metrics_on"]["rps"]
+    report["throughput_change_pct"] = round((on - off) / off * 100, 2) if off else 0
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--requests", type=int, default=20000)
+    ap.add_argument("--clients", type=int, default=50)
+    ap.add_argument("--number", type=int, default=200000)
+    args = ap.parse_args()
+    print(run(args.requests, args.clients, args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Micro-benchmarks of the pure-Python per-request hot paths.
+
+Each case runs one hot function with a representative input: the query builder
+(add_filters, query_builder, form_search_query), create_token (two JWT encodes,
+the session write replaced by a no-op), JWT.validate, and pydantic validation
+and serialisation of TaskModel / DefaultResponseSchema. Each case is timed in
+alternating batches with a fixed pure-Python reference workload; the report
+gives ops/sec (median batch), the cost relative to the reference (median of
+the per-round ratios) and the tracemalloc peak of one call, i.e. the memory a
+call allocates on top of what is already live.
+
+Results are compared with the committed baseline; a case fails the run when
+its relative cost, or its peak allocation, grows by more than --threshold.
+Comparing relative cost rather than raw ops/sec keeps the baseline usable
+across machines. Repeated runs on an unchanged tree stay within about 15% of
+each other on a single noisy core, so the default threshold is 40%; peak
+allocations are exact from run to run:
+
+    python -m benchmarks.micro                   # compare with the baseline
+    python -m benchmarks.micro --filter builder  # only the matching cases
+    python -m benchmarks.micro --save            # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+from benchmarks.query_builder import FILTER_MODELS
+from benchmarks.seed import generate_tasks
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "micro.json")
+ALLOC_SAMPLES = 50
+ROUNDS = 9
+
+
+class _NullSessionStore:
+    async def create(self, login_token, mapping, ttl) -> None:
+        pass
+
+
+def _run_sync(coroutine):
+    """
+    Runs a coroutine that never suspends without an event loop, so only the
+    function's own work is timed.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("Benchmarked coroutine suspended")
+
+
+def _builder_cases() -> Dict[str, Callable]:
+    from scripts.core.db.mongo.aggregate.tasks_aggregate import TaskAggregate
+    from scripts.core.schemas.task_model import FetchTaskModel
+    from scripts.utils.mongo_util import MongoQueryBuilder
+
+    builder = MongoQueryBuilder()
+    cases = {}
+    for name, filters in FILTER_MODELS.items():
+        request_data = FetchTaskModel(user_id="user_bench", filters=filters, page_size=50)
+
+        def add_filters(request_data=request_data):
+            query = TaskAggregate.fetch_tasks(user_ids=["user_bench"], role="developer")
+            return builder.add_filters(query=query, input_data=request_data)
+
+        cases[f"builder.add_filters.{name}"] = add_filters
+    filter_model = FILTER_MODELS["grid_four_filters_two_sorts"]["filterModel"]
+    cases["builder.query_builder"] = lambda: builder.query_builder(filter_model)
+    cases["builder.form_search_query"] = lambda: builder.form_search_query(
+        filter_model["title"]
+    )
+    return cases
+
+
+def _token_cases() -> Dict[str, Callable]:
+    import scripts.utils.create_token as create_token_module
+    from scripts.utils.jwt import JWT
+
+    create_token_module.session_store = _NullSessionStore()
+    jwt = JWT()
+    token = jwt.encode(
+        {
+            "ip": "127.0.0.1",
+            "user_id": "user_bench",
+            "token": "bench",
+            "uid": "0" * 32,
+            "age": 30,
+            "exp": datetime.now(timezone.utc) + timedelta(days=1),
+        }
+    )
+    return {
+        "token.create_token": lambda: _run_sync(
+            create_token_module.create_token("user_bench", "127.0.0.1", "bench")
+        ),
+        "token.jwt_validate": lambda: jwt.validate(token),
+    }
+
+
+def _schema_cases() -> Dict[str, Callable]:
+    from scripts.core.schemas import DefaultResponseSchema
+    from scripts.core.schemas.task_model import TaskModel
+
+    tasks = list(generate_tasks(100))
+    task = TaskModel.model_validate(tasks[0])
+    return {
+        "pydantic.task_validate": lambda: TaskModel.model_validate(tasks[0]),
+        "pydantic.task_dump": lambda: task.model_dump(),
+        "pydantic.response_100_tasks": lambda: DefaultResponseSchema(
+            data=tasks
+        ).model_dump(),
+    }
+
+
+def _reference():
+    # Dict, string and list work in roughly the mix of the cases above.
+    row = {f"field_{i}": str(i) for i in range(20)}
+    return sorted(key.upper() for key, value in row.items() if value)
+
+
+def cases() -> Dict[str, Callable]:
+    return {**_builder_cases(), **_token_cases(), **_schema_cases()}
+
+
+def _peak_bytes(call: Callable) -> int:
+    samples = []
+    tracemalloc.start()
+    try:
+        for _ in range(ALLOC_SAMPLES):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            call()
+            samples.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return int(statistics.median(samples))
+
+
+def _interleaved(call: Callable) -> Dict[str, float]:
+    """
+    Times `call` and the reference in alternating batches so both see the
+    same host load, and returns the median batch time and the median of the
+    per-round cost ratios. A burst of noise then skews one round, not the
+    result.
+    """
+    call()
+    case_number, _ = timeit.Timer(call).autorange()
+    reference_number, _ = timeit.Timer(_reference).autorange()
+    seconds, ratios = [], []
+    for _ in range(ROUNDS):
+        reference = timeit.timeit(_reference, number=reference_number)
+        elapsed = timeit.timeit(call, number=case_number) / case_number
+        seconds.append(elapsed)
+        ratios.append(elapsed / (reference / reference_number))
+    return {
+        "seconds": statistics.median(seconds),
+        "ratio": statistics.median(ratios),
+    }
+
+
+def measure(call: Callable) -> Dict:
+    timing = _interleaved(call)
+    return {
+        "ops_per_sec": round(1 / timing["seconds"], 1),
+        "us_per_op": round(timing["seconds"] * 1e6, 3),
+        "relative_cost": round(timing["ratio"], 3),
+        "peak_bytes": _peak_bytes(call),
+    }
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Lists the cases whose relative cost or peak allocation grew by more than
+    `threshold` (a fraction) against the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("cases", {}).get(name)
+        if not previous:
+            continue
+        for field in ("relative_cost", "peak_bytes"):
+            before, after = previous[field], result[field]
+            if before and (after - before) / before > threshold:
+                regressions.append(f"{name} {field}: {before} -> {after}")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--filter", default="", help="Only run cases containing this")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save", action="store_true", help="Write results as baseline")
+    ap.add_argument("--threshold", type=float, default=0.4)
+    args = ap.parse_args()
+
+    results = {}
+    for name, call in cases().items():
+        if args.filter in name:
+            results[name] = measure(call)
+            result = results[name]
+            print(f"{name:<50} {result['ops_per_sec']:>12} ops/s "
+                  f"{result['us_per_op']:>10} us/op x{result['relative_cost']:<8} "
+                  f"{result['peak_bytes']:>7} B peak")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "recorded_at": int(time.time()),
+        },
+        "cases": results,
+    }
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, record one with --save")
+        return
+    with open(args.baseline) as file:
+        regressions = compare(results, json.load(file), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
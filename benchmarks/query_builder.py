@@ -0,0 +1,66 @@
+"""
+Micro-benchmark of the per-request MongoQueryBuilder cost.
+
+Builds the fetch pipeline for a set of realistic AG-Grid filter/sort models
+and reports microseconds per call. Only pure Python runs here, no database
+is needed:
+
+    python -m benchmarks.query_builder --number 20000
+"""
+
+import argparse
+import copy
+import timeit
+
+from scripts.core.db.mongo.aggregate.tasks_aggregate import TaskAggregate
+from scripts.core.schemas.task_model import FetchTaskModel
+from scripts.utils.mongo_util import MongoQueryBuilder
+
+FILTER_MODELS = {
+    "no_filters": {"filterModel": {}, "sortModel": []},
+    "single_contains": {
+        "filterModel": {"title": {"filterType": "text", "type": "contains", "filter": "deploy"}},
+        "sortModel": [],
+    },
+    "grid_four_filters_two_sorts": {
+        "filterModel": {
+            "title": {"filterType": "text", "type": "contains", "filter": "release"},
+            "status": {"filterType": "text", "type": "equals", "filter": "Open"},
+            "description": {"filterType": "text", "type": "notContains", "filter": "wip"},
+            "comments": {"filterType": "text", "type": "startsWith", "filter": "blocked"},
+        },
+        "sortModel": [
+            {"colId": "due_date", "sort": "asc"},
+            {"colId": "created_at", "sort": "desc"},
+        ],
+    },
+}
+
+
+def bench_model(name: str, filters: dict, number: int, page_size=None) -> dict:
+    builder = MongoQueryBuilder()
+    base = FetchTaskModel(user_id="user_bench", filters=filters, page_size=page_size)
+
+    def build():
+        request_data = base.model_copy(deep=True)
+        query = TaskAggregate.fetch_tasks(user_ids=["user_bench"], role="developer")
+        builder.add_filters(query=query, input_data=request_data)
+
+    build()
+    best = min(timeit.repeat(build, number=number, repeat=5))
+    return {"model": name, "page_size": page_size, "us_per_call": round(best / number * 1e6, 2)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--number", type=int, default=20000)
+    args = ap.parse_args()
+    for name, filters in FILTER_MODELS.items():
+        for page_size in (None, 50):
+            result = bench_model(name, copy.deepcopy(filters), args.number, page_size)
+            print(f"{result['model']:<30} page_size={str(page_size):<5} "
+                  f"{result['us_per_call']:>8} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Raw BSON passthrough benchmark: CPU time and peak RSS of turning a task query
+result into the JSON response body.
+
+  dict : driver decodes every document into a dict, orjson encodes the list
+         (the default fetch path)
+  raw  : raw BSON batches decoded and encoded one batch at a time, so only
+         one batch of dicts is alive (the fetch path with RAW_BSON_READS=true)
+
+Each mode runs in its own process so peak RSS is not shared. By default the
+BSON batches are generated locally (benchmarks.seed), so the conversion cost is
+measured without a server; --mongo runs the real aggregate against the
+configured Mongo instead (seeding it unless --skip-seed):
+
+    python -m benchmarks.raw_bson --tasks 100000
+    python -m benchmarks.raw_bson --tasks 100000 --mongo
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import bson
+import orjson
+
+from benchmarks.seed import generate_tasks, seed_tasks
+
+BATCH_SIZE = 1000
+MODES = ("dict", "raw")
+
+
+class _Batches:
+    """
+    Async iterator over pre-encoded BSON batches, shaped like a raw batch cursor.
+    """
+
+    def __init__(self, batches):
+        self._batches = iter(batches)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._batches)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def _generated_batches(count: int) -> list:
+    documents = [bson.encode(task) for task in generate_tasks(count)]
+    return [
+        b"".join(documents[offset: offset + BATCH_SIZE])
+        for offset in range(0, len(documents), BATCH_SIZE)
+    ]
+
+
+async def _convert_generated(mode: str, batches: list) -> bytes:
+    from scripts.utils.mongo_util import raw_batches_to_json
+
+    if mode == "raw":
+        return await raw_batches_to_json(_Batches(batches))
+    tasks = [task for batch in batches for task in bson.decode_all(batch)]
+    return orjson.dumps(tasks, default=str)
+
+
+async def _convert_mongo(mode: str) -> bytes:
+    from scripts.core.db.mongo import mongo_client
+    from scripts.core.db.mongo.task_manager.tasks import TaskMongo
+    from scripts.utils.mongo_util import raw_batches_to_json
+
+    task_mongo = TaskMongo(mongo_client=mongo_client)
+    pipeline = [{"$match": {}}, {"$project": {"_id": 0}}]
+    if mode == "raw":
+        return await raw_batches_to_json(
+            task_mongo.aggregate(pipelines=pipeline, raw_batches=True)
+        )
+    cursor = task_mongo.aggregate(pipelines=pipeline)
+    return orjson.dumps(await cursor.to_list(length=None), default=str)
+
+
+def _worker(mode: str, tasks: int, mongo: bool) -> dict:
+    batches = None if mongo else _generated_batches(tasks)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    if mongo:
+        body = asyncio.run(_convert_mongo(mode))
+    else:
+        body = asyncio.run(_convert_generated(mode, batches))
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "mode": mode,
+        "cpu_ms": round(cpu * 1000, 1),
+        "wall_ms": round(wall * 1000, 1),
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        "rss_growth_mb": round((peak_kb - baseline_kb) / 1024, 1),
+        "body_bytes": len(body),
+    }
+
+
+def run(tasks: int, mongo: bool, skip_seed: bool) -> dict:
+    if mongo and not skip_seed:
+        asyncio.run(_seed(tasks))
+    report = {"tasks": tasks, "source": "mongo" if mongo else "generated"}
+    for mode in MODES:
+        command = [sys.executable, "-m", "benchmarks.raw_bson", "--worker", mode]
+        command += ["--tasks", str(tasks)] + (["--mongo"] if mongo else [])
+        output = subprocess.run(command, check=True, capture_output=True, text=True)
+        report[mode] = json.loads(output.stdout)
+    return report
+
+
+async def _seed(tasks: int) -> None:
+    from scripts.config.constants import CollectionMap, DBMapping
+    from scripts.core.db.mongo import mongo_client
+
+    collection = mongo_client[DBMapping.task_manager][CollectionMap.tasks]
+    await collection.delete_many({})
+    await seed_tasks(collection, tasks)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--tasks", type=int, default=100_000)
+    ap.add_argument("--mongo", action="store_true", help="Query the configured Mongo")
+    ap.add_argument("--skip-seed", action="store_true", help="Reuse existing tasks")
+    ap.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.tasks, args.mongo)))
+    else:
+        print(run(args.tasks, args.mongo, args.skip_seed))
+
+
+if __name__ == "__main__":
+    main()
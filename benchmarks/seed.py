@@ -0,0 +1,107 @@
+"""
+Deterministic task data generator.
+
+Generates realistic tasks (titles, descriptions and comments drawn from a fixed
+vocabulary, spread over a pool of assignees and groups) from a seed, so that
+every benchmark run sees the same data. Can seed the configured Mongo directly:
+
+    python -m benchmarks.seed --size 100k --drop
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Iterator, List
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+VOCABULARY = (
+    "deploy release build pipeline review merge branch hotfix rollback database "
+    "migration index query cache latency timeout retry queue worker schedule "
+    "backup restore monitor alert dashboard metric report invoice customer "
+    "onboarding signup login password token session permission group role "
+    "admin audit export import upload download search filter sort page grid "
+    "mobile desktop browser android ios design layout theme colour font icon "
+    "document spec proposal meeting sync planning sprint backlog estimate bug "
+    "crash leak regression flaky test coverage benchmark profile optimise "
+    "refactor cleanup upgrade dependency security patch vulnerability scan "
+    "network proxy certificate domain email notification webhook integration"
+).split()
+
+STATUSES = ("Open", "In Progress", "Blocked", "Review", "Done")
+
+
+def assignee_pool(users: int = 500, groups: int = 50) -> List[str]:
+    return [f"user_seed_{i}" for i in range(users)] + [
+        f"group_seed_{i}" for i in range(groups)
+    ]
+
+
+def _words(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, k=rng.randint(low, high)))
+
+
+def generate_tasks(count: int, seed: int = 42) -> Iterator[dict]:
+    """
+    Yields `count` task documents in the stored TaskModel shape.
+    Args:
+        count: Number of tasks to generate.
+        seed: Random seed, the same seed always yields the same tasks.
+    """
+    rng = random.Random(seed)
+    assignees = assignee_pool()
+    now = int(time.time())
+    for index in range(count):
+        created_at = now - rng.randint(0, 365 * 24 * 3600)
+        yield {
+            "task_id": f"seed{seed}_{index:08d}",
+            "title": _words(rng, 3, 6).capitalize(),
+            "description": _words(rng, 10, 30),
+            "assigned_to": rng.choice(assignees),
+            "meta": {
+                "created_by": rng.choice(assignees),
+                "created_at": created_at,
+                "updated_at": 0,
+                "updated_by": "",
+            },
+            "due_date": created_at + rng.randint(3600, 60 * 24 * 3600),
+            "comments": _words(rng, 0, 10),
+            "status": rng.choice(STATUSES),
+        }
+
+
+async def seed_tasks(collection, count: int, seed: int = 42, batch_size: int = 5000):
+    """
+    Inserts generated tasks into a motor collection in unordered batches.
+    """
+    batch = []
+    for task in generate_tasks(count, seed):
+        batch.append(task)
+        if len(batch) >= batch_size:
+            await collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await collection.insert_many(batch, ordered=False)
+
+
+async def _main(args):
+    from scripts.config.constants import CollectionMap, DBMapping
+    from scripts.core.db.mongo import mongo_client
+    from scripts.core.db.mongo.indexes import ensure_indexes
+
+    collection = mongo_client[DBMapping.task_manager][CollectionMap.tasks]
+    if args.drop:
+        await collection.delete_many({})
+    start = time.perf_counter()
+    await seed_tasks(collection, SIZES[args.size], seed=args.seed)
+    await ensure_indexes(mongo_client)
+    print(f"Seeded {SIZES[args.size]} tasks in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--size", choices=SIZES, default="10k")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--drop", action="store_true", help="Remove existing tasks first")
+    asyncio.run(_main(ap.parse_args()))
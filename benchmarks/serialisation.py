@@ -0,0 +1,50 @@
+"""
+Response serialisation benchmark for large task lists.
+
+Serialises the `{status, message, data}` envelope of generated tasks (10k by
+default, see benchmarks.seed) through FastAPI's default path
+(jsonable_encoder + JSONResponse) and through ORJSONEnvelopeResponse, the
+path used by routers with `route_class=ORJSONEnvelopeRoute`:
+
+    python -m benchmarks.serialisation --tasks 10000 --repeat 5
+"""
+
+import argparse
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from benchmarks.seed import generate_tasks
+from scripts.core.schemas import DefaultResponseSchema
+from scripts.utils.response_util import ORJSONEnvelopeResponse
+
+
+def default_path(tasks: list) -> bytes:
+    return JSONResponse(jsonable_encoder(DefaultResponseSchema(data=tasks))).body
+
+
+def orjson_path(tasks: list) -> bytes:
+    return ORJSONEnvelopeResponse(dict(DefaultResponseSchema(data=tasks))).body
+
+
+def run(count: int, repeat: int) -> dict:
+    tasks = list(generate_tasks(count))
+    report = {"tasks": count}
+    for name, path in (("default", default_path), ("orjson", orjson_path)):
+        best = min(timeit.repeat(lambda: path(tasks), number=1, repeat=repeat))
+        report[name] = {"ms": round(best * 1000, 2), "bytes": len(path(tasks))}
+    report["speedup"] = round(report["default"]["ms"] / report["orjson"]["ms"], 2)
+    return report
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--tasks", type=int, default=10_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    print(run(args.tasks, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Startup-time benchmark with a budget.
+
+Each run starts a fresh interpreter that imports `main`, runs the app lifespan
+and sends requests through the ASGI transport until GET /readyz answers 200,
+and reports:
+
+  import_ms         importing main
+  startup_ms        the lifespan startup (pool warm-up, indexes, listeners)
+  first_request_ms  from the end of startup to the first successful /readyz
+  ready_ms          from before the import to that first successful request
+
+It also checks that importing main has no side effects: no thread started and
+no Mongo or Redis client created. The run fails when a check fails or a median
+exceeds its budget:
+
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --backend local --budget-ready-ms 1500
+
+`stub` uses the in-process stand-ins of benchmarks.load_test, `local` the
+configured MONGO_URI / REDIS_URI.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+BUDGET_MS = {"import_ms": 2000, "ready_ms": 3000}
+FIELDS = ("import_ms", "startup_ms", "first_request_ms", "ready_ms")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+async def _first_request(app, deadline: float) -> int:
+    import httpx
+
+    from scripts.api import Endpoints
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://startup") as client:
+        while True:
+            response = await client.get(Endpoints.api_readyz)
+            if response.status_code == 200 or time.perf_counter() > deadline:
+                return response.status_code
+            await asyncio.sleep(0.05)
+
+
+async def _start(app, timeout: float) -> tuple:
+    started = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        status = await _first_request(app, ready + timeout)
+        answered = time.perf_counter()
+    return started, ready, answered, status
+
+
+def _worker(backend: str, timeout: float) -> dict:
+    start = time.perf_counter()
+    import main
+
+    imported = time.perf_counter()
+    side_effects = []
+    if threading.active_count() > 1:
+        side_effects.append(f"threads {[t.name for t in threading.enumerate()]}")
+    for resource in (main.mongo_client, main.login_db):
+        if resource.is_open:
+            side_effects.append(f"{resource.name} client created")
+
+    if backend == "stub":
+        from benchmarks.load_test import install_stand_ins
+
+        install_stand_ins()
+    started, ready, answered, status = asyncio.run(_start(main.app, timeout))
+    return {
+        "import_ms": _ms(imported - start),
+        "startup_ms": _ms(ready - started),
+        "first_request_ms": _ms(answered - ready),
+        # Stand-in setup between the import and the lifespan is not counted
+        "ready_ms": _ms(imported - start + answered - started),
+        "status": status,
+        "side_effects": side_effects,
+    }
+
+
+def run(runs: int, backend: str, timeout: float) -> dict:
+    results = []
+    for _ in range(runs):
+        command = [sys.executable, "-m", "benchmarks.startup", "--worker",
+                   "--backend", backend, "--timeout", str(timeout)]
+        output = subprocess.run(
+            command, check=True, capture_output=True, text=True, cwd=ROOT
+        )
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    report = {
+        field: round(statistics.median(result[field] for result in results), 1)
+        for field in FIELDS
+    }
+    report["failed_requests"] = sum(result["status"] != 200 for result in results)
+    report["side_effects"] = sorted({e for result in results for e in result["side_effects"]})
+    return report
+
+
+def check(report: dict, budget: dict) -> list:
+    failures = [f"{field} {report[field]} > {limit} ms"
+                for field, limit in budget.items() if report[field] > limit]
+    if report["failed_requests"]:
+        failures.append(f"{report['failed_requests']} run(s) never became ready")
+    failures += [f"import side effect: {effect}" for effect in report["side_effects"]]
+    return failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--backend", choices=("stub", "local"), default="stub")
+    ap.add_argument("--timeout", type=float, default=10, help="Seconds to wait for /readyz")
+    ap.add_argument("--budget-import-ms", type=float, default=BUDGET_MS["import_ms"])
+    ap.add_argument("--budget-ready-ms", type=float, default=BUDGET_MS["ready_ms"])
+    ap.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.worker:
+        print(json.dumps(_worker(args.backend, args.timeout)))
+        return
+    report = run(args.runs, args.backend, args.timeout)
+    print(json.dumps(report))
+    failures = check(
+        report, {"import_ms": args.budget_import_ms, "ready_ms": args.budget_ready_ms}
+    )
+    for failure in failures:
+        print(f"FAILED {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
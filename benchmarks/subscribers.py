@@ -0,0 +1,105 @@
+"""
+Fan-out benchmark for /task/subscribe.
+
+Opens many idle websocket subscribers for one user, then creates tasks
+assigned to that user and measures how long each event takes to reach every
+subscriber. Point --base-url at a single worker to measure per-worker limits
+(raise `ulimit -n` above the subscriber count first):
+
+    python -m benchmarks.subscribers --subscribers 10000 --events 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+import websockets
+
+from benchmarks._common import DEFAULT_BASE_URL, login, percentile, print_report
+from benchmarks.bulk_tasks import make_task
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+
+async def _subscriber(url, headers, ready, received, stop):
+    async with websockets.connect(
+        url, extra_headers=headers, open_timeout=60, ping_interval=None
+    ) as websocket:
+        ready.release()
+        while not stop.is_set():
+            try:
+                message = await asyncio.wait_for(websocket.recv(), timeout=1)
+            except asyncio.TimeoutError:
+                continue
+            event = json.loads(message)
+            if event.get("type") == "created":
+                received.setdefault(event["task_id"], []).append(time.perf_counter())
+
+
+async def run(base_url: str, subscribers: int, events: int, connect_batch: int) -> dict:
+    ws_url = base_url.replace("http", "ws", 1) + (
+        f"{Endpoints.api_task}{Endpoints.api_subscribe}"
+    )
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        token, user_id = await login(client, user_role="user")
+        headers = {Secrets.access_token: token}
+        ready, received, stop = asyncio.Semaphore(0), {}, asyncio.Event()
+        connect_start = time.perf_counter()
+        tasks = []
+        for offset in range(0, subscribers, connect_batch):
+            batch = min(connect_batch, subscribers - offset)
+            tasks += [
+                asyncio.create_task(_subscriber(ws_url, headers, ready, received, stop))
+                for _ in range(batch)
+            ]
+            for _ in range(batch):
+                await ready.acquire()
+        connect_s = time.perf_counter() - connect_start
+
+        sent = {}
+        path = f"{Endpoints.api_task}{Endpoints.api_create}"
+        for index in range(events):
+            sent_at = time.perf_counter()
+            response = await client.post(
+                path, json=make_task(user_id, index), headers=headers
+            )
+            sent[response.json()["data"]] = sent_at
+            await asyncio.sleep(0.5)
+        await asyncio.sleep(2)
+        stop.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    fan_out, delivered = [], 0
+    for task_id, sent_at in sent.items():
+        arrivals = received.get(task_id, [])
+        delivered += len(arrivals)
+        if arrivals:
+            fan_out.append(max(arrivals) - sent_at)
+    return {
+        "subscribers": subscribers,
+        "connect_s": round(connect_s, 2),
+        "events": events,
+        "delivery_ratio": round(delivered / (subscribers * events), 4) if events else 0,
+        "fan_out_p50_ms": round(percentile(fan_out, 50) * 1000, 2),
+        "fan_out_p95_ms": round(percentile(fan_out, 95) * 1000, 2),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    ap.add_argument("--subscribers", type=int, default=10000)
+    ap.add_argument("--events", type=int, default=20)
+    ap.add_argument("--connect-batch", type=int, default=500)
+    ap.add_argument("--label", default="subscribers")
+    args = ap.parse_args()
+    report = asyncio.run(
+        run(args.base_url, args.subscribers, args.events, args.connect_batch)
+    )
+    print_report(args.label, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Text search benchmark: `contains` regex filter vs the task_text index.
+
+Seeds the configured Mongo with generated tasks (1M by default, see
+benchmarks.seed) and runs the same word lookups through both fetch paths,
+first page of 50 as the grid would request it:
+
+    python -m benchmarks.text_search --size 1m --queries 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks._common import percentile
+from benchmarks.seed import SIZES, VOCABULARY, seed_tasks
+from scripts.config.constants import CollectionMap, DBMapping
+from scripts.core.db.mongo.aggregate.tasks_aggregate import TaskAggregate
+from scripts.core.schemas.task_model import FetchTaskModel
+from scripts.utils.mongo_util import MongoQueryBuilder
+
+
+def _pipeline(word: str, use_search: bool) -> list:
+    filters = (
+        {"search": word}
+        if use_search
+        else {"filterModel": {"title": {"type": "contains", "filter": word}}}
+    )
+    request_data = FetchTaskModel(user_id="bench", filters=filters, page_size=50)
+    query = TaskAggregate.fetch_tasks(user_ids=[], role="admin")
+    return MongoQueryBuilder().add_filters(query=query, input_data=request_data)
+
+
+async def _time_path(collection, words, use_search):
+    latencies = []
+    for word in words:
+        start = time.perf_counter()
+        await collection.aggregate(_pipeline(word, use_search)).to_list(length=None)
+        latencies.append(time.perf_counter() - start)
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+    }
+
+
+async def run(size: str, queries: int, skip_seed: bool):
+    from scripts.core.db.mongo import mongo_client
+    from scripts.core.db.mongo.indexes import ensure_indexes
+
+    collection = mongo_client[DBMapping.task_manager][CollectionMap.tasks]
+    if not skip_seed:
+        await collection.delete_many({})
+        await seed_tasks(collection, SIZES[size])
+    await ensure_indexes(mongo_client)
+    words = random.Random(7).choices(VOCABULARY, k=queries)
+    return {
+        "tasks": await collection.estimated_document_count(),
+        "regex_contains": await _time_path(collection, words, use_search=False),
+        "text_search": await _time_path(collection, words, use_search=True),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--size", choices=SIZES, default="1m")
+    ap.add_argument("--queries", type=int, default=50)
+    ap.add_argument("--skip-seed", action="store_true", help="Reuse existing tasks")
+    args = ap.parse_args()
+    print(asyncio.run(run(args.size, args.queries, args.skip_seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Worker scaling benchmark.
+
+Starts `app.py --workers N` for each N, drives it from several client
+processes (so the load generator is not the bottleneck) and reports throughput
+and latency per worker count, plus the speed-up over one worker:
+
+    python -m benchmarks.workers --workers 1 2 4 --target fetch --duration 20
+    python -m benchmarks.workers --workers 1 2 4 --target root
+
+`fetch` polls /task/fetch as a logged-in admin and needs the configured Mongo
+and Redis; `root` hits GET / and measures the server and framework alone.
+Scaling is bounded by the cores left over for the client processes.
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+from benchmarks._common import login, summarise
+from scripts.api import Endpoints
+from scripts.config.constants import Secrets
+
+FETCH_PATH = f"{Endpoints.api_task}{Endpoints.api_fetch}"
+
+
+async def _drive(base_url, target, clients, duration, token, user_id):
+    limits = httpx.Limits(max_connections=clients)
+    latencies, errors = [], 0
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        method, path, kwargs = "GET", "/", {}
+        if target == "fetch":
+            method, path = "POST", FETCH_PATH
+            kwargs = {
+                "json": {
+                    "user_id": user_id,
+                    "filters": {"filterModel": {}, "sortModel": []},
+                    "page_size": 50,
+                },
+                "headers": {Secrets.access_token: token},
+            }
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    (await client.request(method, path, **kwargs)).raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                except httpx.HTTPError:
+                    errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(clients)))
+    return latencies, errors
+
+
+def _client_process(*args):
+    return asyncio.run(_drive(*args))
+
+
+def _wait_ready(base_url: str, timeout: float = 60) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{base_url}/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Service at {base_url} did not start")
+
+
+def run_workers(workers, args) -> dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "app.py", "--workers", str(workers), "--port", str(args.port),
+         "--bind", "127.0.0.1"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready(base_url)
+        token, user_id = "", ""
+        if args.target == "fetch":
+            token, user_id = asyncio.run(_login(base_url))
+        start = time.perf_counter()
+        with ProcessPoolExecutor(args.client_procs) as pool:
+            futures = [
+                pool.submit(_client_process, base_url, args.target, args.clients,
+                            args.duration, token, user_id)
+                for _ in range(args.client_procs)
+            ]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+    finally:
+        # SIGTERM lets uvicorn drain and run the lifespan shutdown
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+    latencies = [latency for result, _ in results for latency in result]
+    return summarise(latencies, elapsed, sum(errors for _, errors in results))
+
+
+async def _login(base_url):
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        return await login(client)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--target", choices=("fetch", "root"), default="fetch")
+    ap.add_argument("--client-procs", type=int, default=max(os.cpu_count() // 2, 1))
+    ap.add_argument("--clients", type=int, default=32, help="Connections per client process")
+    ap.add_argument("--duration", type=float, default=20)
+    ap.add_argument("--port", type=int, default=6970)
+    args = ap.parse_args()
+    baseline = None
+    for workers in args.workers:
+        result = run_workers(workers, args)
+        baseline = baseline or result["rps"]
+        speedup = round(result["rps"] / baseline, 2) if baseline else 0.0
+        print(f"workers={workers:<3} {result['rps']:>10} req/s  x{speedup:<5} "
+              f"p50 {result['p50_ms']} p99 {result['p99_ms']} ms  errors {result['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,68 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from scripts.config import Mongo
+from scripts.core.db.mongo import mongo_client
+from scripts.core.db.redis import login_db
+from scripts.core.db.mongo.indexes import ensure_indexes
+from scripts.core.services.health_services import health_router
 from scripts.core.services.login_services import login_router
+from scripts.core.services.metrics_services import metrics_router
 from scripts.core.services.task_services import task_router
 from scripts.core.services.user_services import user_router
+from scripts.logging import log_writer, logger
+from scripts.utils.activity_buffer import activity_buffer
+from scripts.utils.metrics_util import MetricsMiddleware
+from scripts.utils.mongo_util import warm_up
+from scripts.utils.password_util import password_hasher
+from scripts.utils.principal_cache import principal_cache
+from scripts.utils.session_cache import session_cache
+from scripts.utils.task_events import task_event_hub
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Pools are created here, inside each worker, and closed after the drain
+    mongo_client.open()
+    login_db.open()
+    try:
+        await warm_up(mongo_client, Mongo.MONGO_MIN_POOL_SIZE)
+    except Exception as e:
+        # Never blocks startup, /readyz keeps failing until Mongo answers
+        logger.warning(f"Mongo warm-up failed : {str(e)}")
+    if Mongo.ENSURE_INDEXES:
+        await ensure_indexes(mongo_client)
+    session_cache.start_listener()
+    principal_cache.start_listener()
+    task_event_hub.start_listener()
+    activity_buffer.start()
+    yield
+    await activity_buffer.stop()
+    await task_event_hub.stop_listener()
+    await principal_cache.stop_listener()
+    await session_cache.stop_listener()
+    password_hasher.shutdown()
+    await login_db.close()
+    await mongo_client.close()
+    # Writes out the records still queued
+    log_writer.stop()
+
 
 app = FastAPI(title="User Task Manager",
               description="Manages user tasks and authentication",
-              version="1.0.0")
+              version="1.0.0",
+              lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+app.add_middleware(MetricsMiddleware)
 
 
 @app.get("/")
@@ -25,3 +73,5 @@ def read_root():
 app.include_router(login_router)
 app.include_router(task_router)
 app.include_router(user_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
@@ -9,3 +9,9 @@ class Endpoints:
     api_create = "/create"
     api_create_group = f"/group{api_create}"
     api_update = "/update"
+    api_bulk_create = "/bulk_create"
+    api_bulk_update = "/bulk_update"
+    api_subscribe = "/subscribe"
+    api_metrics = "/metrics"
+    api_healthz = "/healthz"
+    api_readyz = "/readyz"
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -6,18 +8,95 @@ class _Services(BaseSettings):
     PORT: int = Field(default=6869, validation_alias="service_port")
     HOST: str = Field(default="0.0.0.0", validation_alias="service_host")
     SECURE_ACCESS: bool = Field(default=True)
+    WORKERS: int = Field(default=1, ge=1)
+    SHUTDOWN_TIMEOUT_SECS: float = Field(default=30, ge=0)
+    READINESS_TIMEOUT_SECS: float = Field(default=2, gt=0)
 
 
 class _Redis(BaseSettings):
     REDIS_URI: str = Field()
+    REDIS_MAX_CONNECTIONS: int = Field(default=64, ge=1)
+    REDIS_POOL_TIMEOUT_SECS: float = Field(default=5, gt=0)
 
 
 class _Mongo(BaseSettings):
     MONGO_URI: str = Field()
+    ENSURE_INDEXES: bool = Field(default=True)
+    RAW_BSON_READS: bool = Field(default=False)
+    MONGO_MAX_POOL_SIZE: int = Field(default=100, ge=1)
+    MONGO_MIN_POOL_SIZE: int = Field(default=5, ge=0)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = Field(default=5000, gt=0)
+    MONGO_CONNECT_TIMEOUT_MS: int = Field(default=5000, gt=0)
+    MONGO_SOCKET_TIMEOUT_MS: int = Field(default=0, ge=0)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(default=5000, gt=0)
+
+
+class _Hashing(BaseSettings):
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+    HASH_POOL_TYPE: Literal["thread", "process"] = Field(default="thread")
+    HASH_POOL_WORKERS: int = Field(default=4, ge=1)
+    HASH_QUEUE_DEPTH: int = Field(default=64, ge=1)
+
+
+class _Session(BaseSettings):
+    SESSION_CACHE_SIZE: int = Field(default=10000, ge=0)
+    SESSION_CACHE_TTL_SECS: float = Field(default=30, ge=0)
+    ACTIVITY_FLUSH_INTERVAL_SECS: float = Field(default=15, ge=0)
+    ACTIVITY_FLUSH_MAX_PENDING: int = Field(default=1000, ge=1)
+
+
+class _Principal(BaseSettings):
+    PRINCIPAL_CACHE_SIZE: int = Field(default=10000, ge=0)
+    PRINCIPAL_CACHE_TTL_SECS: float = Field(default=60, ge=0)
+
+
+class _ResultCache(BaseSettings):
+    RESULT_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, ge=0)
+    RESULT_CACHE_MAX_ENTRY_BYTES: int = Field(default=4 * 1024 * 1024, ge=0)
+    RESULT_CACHE_TTL_SECS: float = Field(default=300, ge=0)
+
+
+class _Logging(BaseSettings):
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        default="INFO"
+    )
+    LOG_FORMAT: Literal["text", "json"] = Field(default="text")
+    LOG_FILE: str = Field(default="application.log")
+    LOG_MAX_BYTES: int = Field(default=10 * 1024 * 1024, ge=0)
+    LOG_BACKUP_COUNT: int = Field(default=5, ge=0)
+    LOG_QUEUE_SIZE: int = Field(default=10000, ge=1)
+    LOG_DEBUG_SAMPLE_RATE: float = Field(default=1.0, ge=0, le=1)
+
+
+class _Metrics(BaseSettings):
+    METRICS_ENABLED: bool = Field(default=True)
+
+
+class _TaskEvents(BaseSettings):
+    SUBSCRIBER_QUEUE_SIZE: int = Field(default=100, ge=1)
+    REVALIDATE_INTERVAL_SECS: float = Field(default=30, gt=0)
 
 
 Services = _Services()
 Redis = _Redis()
 Mongo = _Mongo()
+Hashing = _Hashing()
+Session = _Session()
+Principal = _Principal()
+ResultCache = _ResultCache()
+Logging = _Logging()
+TaskEvents = _TaskEvents()
+Metrics = _Metrics()
 
-__all__ = ["Services", "Redis", "Mongo"]
+__all__ = [
+    "Services",
+    "Redis",
+    "Mongo",
+    "Hashing",
+    "Session",
+    "Principal",
+    "ResultCache",
+    "Logging",
+    "TaskEvents",
+    "Metrics",
+]
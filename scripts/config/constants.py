@@ -8,6 +8,55 @@ class CollectionMap:
     groups = "groups"
 
 
+class IndexMap:
+    """
+    Indexes ensured on startup, keyed by collection name.
+    Each entry is (name, [(field, direction), ...], unique) with an optional
+    fourth element of extra index options.
+    Sort indexes follow the default grid orders (newest first, earliest due
+    first) with task_id ascending as the keyset pagination tiebreaker.
+    """
+
+    indexes = {
+        CollectionMap.user: [
+            ("username_unique", [("username", 1)], True),
+            ("email_unique", [("email", 1)], True),
+            ("user_id_unique", [("user_id", 1)], True),
+        ],
+        CollectionMap.tasks: [
+            ("task_id_unique", [("task_id", 1)], True),
+            ("assigned_to_task_id", [("assigned_to", 1), ("task_id", 1)], False),
+            (
+                "assigned_to_created_at",
+                [("assigned_to", 1), ("meta.created_at", -1), ("task_id", 1)],
+                False,
+            ),
+            (
+                "assigned_to_due_date",
+                [("assigned_to", 1), ("due_date", 1), ("task_id", 1)],
+                False,
+            ),
+            ("created_at", [("meta.created_at", -1), ("task_id", 1)], False),
+            ("due_date", [("due_date", 1), ("task_id", 1)], False),
+            (
+                "task_text",
+                [("title", "text"), ("description", "text"), ("comments", "text")],
+                False,
+                {"weights": {"title": 10, "description": 5, "comments": 1}},
+            ),
+        ],
+        CollectionMap.groups: [
+            ("group_id_unique", [("group_id", 1)], True),
+        ],
+    }
+
+
+class RedisChannels:
+    session_invalidation = "session:invalidate"
+    principal_invalidation = "principal:invalidate"
+    task_events = "task:events"
+
+
 class Secrets:
     LEEWAY_IN_MINS: int = 10
     ALG = "HS256"
@@ -24,3 +73,23 @@ class QueryConstants:
     key_mongo_mapping = {"created_at": "meta.created_at"}
     options = "$options"
     regex = "$regex"
+    sort = "$sort"
+    limit = "$limit"
+    and_ = "$and"
+    or_ = "$or"
+    gt = "$gt"
+    lt = "$lt"
+    ne = "$ne"
+    tiebreaker_key = "task_id"
+    text = "$text"
+    search = "$search"
+    add_fields = "$addFields"
+    group = "$group"
+    search_score_key = "search_score"
+    max_page_size = 1000
+    stream_batch_size = 500
+    plan_cache_size = 512
+    max_bulk_size = 5000
+    ndjson_media_type = "application/x-ndjson"
+    etag_header = "ETag"
+    if_none_match_header = "if-none-match"
@@ -1,4 +1,10 @@
 from scripts.config import Mongo
-from scripts.utils.mongo_util import MongoConnect
+from scripts.utils.lifespan_util import LazyResource
+from scripts.utils.mongo_util import AsyncMongoConnect
 
-mongo_client = MongoConnect(uri=Mongo.MONGO_URI)()
+# Built per worker by the app lifespan, never inherited across a fork
+mongo_client = LazyResource(
+    "mongo",
+    factory=lambda: AsyncMongoConnect(uri=Mongo.MONGO_URI)(),
+    closer=lambda client: client.close(),
+)
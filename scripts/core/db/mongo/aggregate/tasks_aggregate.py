@@ -11,3 +11,16 @@ class TaskAggregate:
             "assigned_to": {QueryConstants.in_: user_ids}
         }
         return base_query
+
+    @staticmethod
+    def version_group():
+        return {
+            QueryConstants.group: {
+                "_id": None,
+                "count": {"$sum": 1},
+                # Every edit bumps a version, updated_at only has second resolution.
+                "version_sum": {"$sum": "$version"},
+                "max_created_at": {"$max": "$meta.created_at"},
+                "max_updated_at": {"$max": "$meta.updated_at"},
+            }
+        }
@@ -0,0 +1,181 @@
+"""
+Declarative index management for the task_manager collections.
+
+Indexes are declared in IndexMap and created idempotently on startup.
+The module also works as a CLI:
+
+    python -m scripts.core.db.mongo.indexes --ensure    # create missing indexes
+    python -m scripts.core.db.mongo.indexes --report    # missing / unused / undeclared
+    python -m scripts.core.db.mongo.indexes --explain   # fail on COLLSCAN hot queries
+"""
+
+import argparse
+import asyncio
+import sys
+
+from pymongo import IndexModel
+
+from scripts.config.constants import CollectionMap, DBMapping, IndexMap
+from scripts.logging import logger
+
+HOT_QUERIES = {
+    CollectionMap.user: [
+        {"find": {"$or": [{"username": "probe"}, {"email": "probe@probe.io"}]}},
+        {"find": {"username": "probe"}},
+        {"find": {"user_id": "probe"}},
+    ],
+    CollectionMap.tasks: [
+        {"find": {"task_id": "probe"}},
+        {"aggregate": [{"$match": {"assigned_to": {"$in": ["probe"]}}}]},
+        {
+            "aggregate": [
+                {"$match": {"assigned_to": {"$in": ["probe"]}}},
+                {"$sort": {"meta.created_at": -1, "task_id": 1}},
+            ]
+        },
+        {
+            "aggregate": [
+                {"$match": {"assigned_to": {"$in": ["probe"]}}},
+                {"$sort": {"due_date": 1, "task_id": 1}},
+            ]
+        },
+        {
+            "aggregate": [
+                {"$match": {}},
+                {"$sort": {"meta.created_at": -1, "task_id": 1}},
+            ]
+        },
+        {"aggregate": [{"$match": {}}, {"$sort": {"due_date": 1, "task_id": 1}}]},
+        {"aggregate": [{"$match": {"$text": {"$search": "probe"}}}]},
+    ],
+}
+
+
+def index_models(collection: str) -> list:
+    return [
+        IndexModel(keys, name=name, unique=unique, **(options[0] if options else {}))
+        for name, keys, unique, *options in IndexMap.indexes.get(collection, [])
+    ]
+
+
+async def ensure_indexes(mongo_client) -> None:
+    """
+    Creates every declared index. Existing identical indexes are left untouched,
+    failures are logged so a bad index never blocks startup.
+    Args:
+        mongo_client: Async Mongo client.
+    """
+    db = mongo_client[DBMapping.task_manager]
+    for collection in IndexMap.indexes:
+        try:
+            created = await db[collection].create_indexes(index_models(collection))
+            logger.debug("Ensured indexes on %s : %s", collection, created)
+        except Exception as e:
+            logger.exception(f"Failed to ensure indexes on {collection} : {str(e)}")
+
+
+async def index_report(mongo_client) -> dict:
+    """
+    Compares the declared indexes with the ones present on the server.
+    Returns:
+        dict: Per collection, the missing, unused (no recorded accesses since
+        server start) and undeclared index names.
+    """
+    db = mongo_client[DBMapping.task_manager]
+    report = {}
+    for collection, declared in IndexMap.indexes.items():
+        declared_names = {index[0] for index in declared}
+        stats = await db[collection].aggregate([{"$indexStats": {}}]).to_list(None)
+        present = {stat["name"]: stat["accesses"]["ops"] for stat in stats}
+        report[collection] = {
+            "missing": sorted(declared_names - present.keys()),
+            "unused": sorted(
+                name for name, ops in present.items() if not ops and name != "_id_"
+            ),
+            "undeclared": sorted(present.keys() - declared_names - {"_id_"}),
+        }
+    return report
+
+
+def _winning_plans(explain: dict) -> list:
+    """
+    Winning plans of an explain output, leaving out rejected candidates: the
+    query's own, the one under an aggregate's $cursor stage and, on a sharded
+    cluster, the one of every shard.
+    """
+    plans = []
+    if winning := explain.get("queryPlanner", {}).get("winningPlan"):
+        shards = winning.get("shards")
+        if shards:
+            plans += [shard.get("winningPlan", {}) for shard in shards]
+        else:
+            plans.append(winning)
+    for stage in explain.get("stages", []):
+        if "$cursor" in stage:
+            plans += _winning_plans(stage["$cursor"])
+    if isinstance(shards := explain.get("shards"), dict):
+        for shard in shards.values():
+            plans += _winning_plans(shard)
+    return plans
+
+
+def _has_collscan(plan) -> bool:
+    if isinstance(plan, dict):
+        if plan.get("stage") == "COLLSCAN":
+            return True
+        return any(_has_collscan(value) for value in plan.values())
+    if isinstance(plan, list):
+        return any(_has_collscan(value) for value in plan)
+    return False
+
+
+async def explain_hot_queries(mongo_client) -> list:
+    """
+    Runs explain on every hot query.
+    Returns:
+        list: (collection, query) pairs whose winning plan contains a COLLSCAN.
+    """
+    db = mongo_client[DBMapping.task_manager]
+    failures = []
+    for collection, queries in HOT_QUERIES.items():
+        for query in queries:
+            if "find" in query:
+                command = {"find": collection, "filter": query["find"]}
+            else:
+                command = {
+                    "aggregate": collection,
+                    "pipeline": query["aggregate"],
+                    "cursor": {},
+                }
+            plan = await db.command("explain", command, verbosity="queryPlanner")
+            if any(_has_collscan(winning) for winning in _winning_plans(plan)):
+                failures.append((collection, query))
+    return failures
+
+
+async def _main(args) -> int:
+    from scripts.core.db.mongo import mongo_client
+
+    exit_code = 0
+    if args.ensure:
+        await ensure_indexes(mongo_client)
+    if args.report:
+        for collection, result in (await index_report(mongo_client)).items():
+            print(f"{collection}: {result}")
+    if args.explain:
+        failures = await explain_hot_queries(mongo_client)
+        for collection, query in failures:
+            print(f"COLLSCAN on {collection}: {query}")
+        print(f"{len(failures)} hot queries without index support")
+        exit_code = 1 if failures else 0
+    return exit_code
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Manage task_manager indexes")
+    ap.add_argument("--ensure", action="store_true", help="Create declared indexes")
+    ap.add_argument("--report", action="store_true", help="Report index usage")
+    ap.add_argument(
+        "--explain", action="store_true", help="Fail if a hot query does a COLLSCAN"
+    )
+    sys.exit(asyncio.run(_main(ap.parse_args())))
@@ -1,8 +1,8 @@
 from scripts.config.constants import DBMapping, CollectionMap
-from scripts.utils.mongo_util import MongoCollectionBaseClass
+from scripts.utils.mongo_util import AsyncMongoCollectionBaseClass
 
 
-class TaskMongo(MongoCollectionBaseClass):
+class TaskMongo(AsyncMongoCollectionBaseClass):
     def __init__(self, mongo_client):
         super().__init__(
             mongo_client,
@@ -1,8 +1,8 @@
 from scripts.config.constants import DBMapping, CollectionMap
-from scripts.utils.mongo_util import MongoCollectionBaseClass
+from scripts.utils.mongo_util import AsyncMongoCollectionBaseClass
 
 
-class UserMongo(MongoCollectionBaseClass):
+class UserMongo(AsyncMongoCollectionBaseClass):
     def __init__(self, mongo_client):
         super().__init__(
             mongo_client, database=DBMapping.task_manager, collection=CollectionMap.user
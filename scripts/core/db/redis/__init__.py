@@ -1,7 +1,16 @@
 from scripts.config import Redis
+from scripts.utils.lifespan_util import LazyResource
 from scripts.utils.redis_util import RedisConnector
 
-# Establish a connection to Redis
 redis_client = RedisConnector(Redis.REDIS_URI)
 
-login_db = redis_client.connect(db=0)
+# Establish a connection to Redis, per worker from the app lifespan
+login_db = LazyResource(
+    "redis",
+    factory=lambda: redis_client.connect_async(
+        db=0,
+        max_connections=Redis.REDIS_MAX_CONNECTIONS,
+        pool_timeout=Redis.REDIS_POOL_TIMEOUT_SECS,
+    ),
+    closer=lambda client: client.aclose(close_connection_pool=True),
+)
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Dict
+
+from scripts.config import Services
+from scripts.core.db.mongo import mongo_client
+from scripts.core.db.redis import login_db
+from scripts.utils.metrics_util import mongo_pool_metrics, redis_pool_usage
+
+
+def _saturation(in_use: int, max_size: int) -> float:
+    return round(in_use / max_size, 3) if max_size else 0.0
+
+
+class HealthHandler:
+    def pools(self) -> Dict:
+        """
+        Connections in use against the pool size of this worker's Mongo and
+        Redis clients. Read from memory, no round trip is made.
+        Returns:
+            Dict: Pool usage and saturation (0-1) per client.
+        """
+        mongo = {
+            address: {
+                "in_use": in_use,
+                "max": max_size,
+                "saturation": _saturation(in_use, max_size),
+            }
+            for address, (in_use, max_size) in mongo_pool_metrics.usage().items()
+        }
+        redis = {}
+        if login_db.is_open:
+            in_use, idle, max_size = redis_pool_usage(login_db.connection_pool)
+            redis = {
+                "in_use": in_use,
+                "idle": idle,
+                "max": max_size,
+                "saturation": _saturation(in_use, max_size),
+            }
+        return {"mongo": mongo, "redis": redis}
+
+    @staticmethod
+    async def _round_trip(ping) -> Dict:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(ping(), timeout=Services.READINESS_TIMEOUT_SECS)
+        except Exception as e:
+            return {"ok": False, "error": str(e) or type(e).__name__}
+        return {
+            "ok": True,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+
+    async def readiness(self) -> Dict:
+        """
+        Pings Mongo and Redis concurrently, each bounded by READINESS_TIMEOUT_SECS.
+        Returns:
+            Dict: Round-trip latency or the error per dependency, pool usage and
+            whether the worker is ready, i.e. both pings succeeded.
+        """
+        mongo, redis = await asyncio.gather(
+            self._round_trip(lambda: mongo_client.admin.command("ping")),
+            self._round_trip(login_db.ping),
+        )
+        return {
+            "ready": mongo["ok"] and redis["ok"],
+            "mongo": mongo,
+            "redis": redis,
+            "pools": self.pools(),
+        }
@@ -1,4 +1,3 @@
-import bcrypt
 import shortuuid
 from fastapi import HTTPException
 from starlette.requests import Request
@@ -7,11 +6,14 @@ from starlette.responses import Response
 from scripts.config.constants import Secrets
 from scripts.core.db.mongo import mongo_client
 from scripts.core.db.mongo.task_manager.user import UserMongo
-from scripts.core.db.redis import login_db
 from scripts.core.schemas.auth_model import UserModel, LoginModel
 from scripts.logging import logger
+from scripts.utils.activity_buffer import activity_buffer
 from scripts.utils.create_token import create_token
 from scripts.utils.jwt import JWT
+from scripts.utils.password_util import password_hasher
+from scripts.utils.session_cache import session_cache
+from scripts.utils.session_store import session_store
 
 
 class LoginHandler:
@@ -19,7 +21,7 @@ class LoginHandler:
         self.users_collection = UserMongo(mongo_client=mongo_client)
         self.jwt = JWT()
 
-    def create_user(self, user: UserModel) -> str:
+    async def create_user(self, user: UserModel) -> str:
         """
         Creates a new user using the provided UserModel object.
         Args:
@@ -28,23 +30,24 @@ class LoginHandler:
             str: ID of the created user.
         Raises:
             HTTPException: If the username or email already exists in the database.
+            PoolSaturatedError: If the password hashing queue is full.
         """
 
-        if self.users_collection.find_one(
+        if await self.users_collection.find_one(
             {"$or": [{"username": user.username}, {"email": user.email}]}
         ):
             raise HTTPException(
                 status_code=400, detail="Username or email already exists"
             )
 
-        hashed_password = bcrypt.hashpw(user.password.encode("utf-8"), bcrypt.gensalt())
+        hashed_password = await password_hasher.hash(user.password)
         user_id = f"user_{str(shortuuid.uuid())}"
         user.user_id = user_id
         user.password = hashed_password
-        self.users_collection.insert_one(user.model_dump())
+        await self.users_collection.insert_one(user.model_dump())
         return user_id
 
-    def authenticate_user(
+    async def authenticate_user(
         self, request: Request, response: Response, request_data: LoginModel
     ):
         """
@@ -61,7 +64,7 @@ class LoginHandler:
         """
 
         try:
-            self._perform_authentication(request_data, request, response)
+            await self._perform_authentication(request_data, request, response)
         except HTTPException as He:
             logger.info(f"Failed to login Invalid username or password: {str(He)}")
             raise
@@ -69,7 +72,7 @@ class LoginHandler:
             logger.info(f"Failed to login : {str(e)}")
             raise
 
-    def _perform_authentication(self, request_data, request, response):
+    async def _perform_authentication(self, request_data, request, response):
         """
         Performs user authentication based on the provided request data.
         Args:
@@ -80,21 +83,24 @@ class LoginHandler:
             None
         Raises:
             HTTPException: If the username or password is invalid during authentication.
+            PoolSaturatedError: If the password verification queue is full.
         """
         try:
-            user = self.users_collection.find_one({"username": request_data.username})
-            if not user or not bcrypt.checkpw(
-                request_data.password.encode("utf-8"), user["password"]
+            user = await self.users_collection.find_one(
+                {"username": request_data.username}
+            )
+            if not user or not await password_hasher.verify(
+                request_data.password, user["password"]
             ):
                 raise HTTPException(
                     status_code=400, detail="Invalid username or password"
                 )
 
-            if user.get("token_id") and login_db.hgetall(user.get("token_id")):
+            if await session_store.exists(user.get("token_id")):
                 logger.debug("UUID exists continuing with the same for login.")
             else:
                 user["token_id"] = ""
-            _uuid = create_token(
+            _uuid = await create_token(
                 user_id=user["user_id"],
                 ip=request.client.host if request.client else "0.0.0.0",
                 token=self.jwt.encode(
@@ -102,7 +108,7 @@ class LoginHandler:
                 ),
                 login_token=user["token_id"],
             )
-            self.users_collection.update_one(
+            await self.users_collection.update_one(
                 query={"user_id": user["user_id"]}, data={"token_id": _uuid}
             )
             response.headers[Secrets.access_token] = _uuid
@@ -110,7 +116,7 @@ class LoginHandler:
             logger.info(f"Failed to validate : {str(e)}")
             raise
 
-    def logout(self, user_id):
+    async def logout(self, user_id):
         """
         Logs out a user by deleting their token from the login database.
         Args:
@@ -121,10 +127,12 @@ class LoginHandler:
             Any Exception raised during the logout process.
         """
         try:
-            user_token = self.users_collection.find_one(
+            user_token = await self.users_collection.find_one(
                 {"user_id": user_id}, filter_dict={"_id": 0, "token_id": 1}
             )
-            login_db.delete(user_token.get("token_id", ""))
+            await session_store.delete(user_token.get("token_id", ""))
+            await session_cache.invalidate(user_token.get("token_id", ""))
+            activity_buffer.discard(user_token.get("token_id", ""))
         except Exception as e:
             logger.info(f"Failed to logout : {str(e)}")
             raise
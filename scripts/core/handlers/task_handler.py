@@ -1,23 +1,41 @@
+import hashlib
 from datetime import timezone, datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
+import orjson
 import shortuuid
+from orjson import Fragment
+from pymongo import InsertOne, UpdateOne
 
+from scripts.config import Mongo
+from scripts.config.constants import QueryConstants
 from scripts.core.db.mongo import mongo_client
 from scripts.core.db.mongo.task_manager.tasks import TaskMongo
 from scripts.core.db.mongo.task_manager.user import UserMongo
-from scripts.core.schemas.task_model import TaskModel, MetaData, FetchTaskModel
-from scripts.exceptions.module_exception import CustomError
+from scripts.core.schemas.task_model import (
+    TaskModel,
+    TaskPatchModel,
+    MetaData,
+    FetchTaskModel,
+    TaskPageModel,
+    BulkItemResult,
+)
+from scripts.exceptions.module_exception import ConflictError, CustomError
 from scripts.logging import logger
 from scripts.core.db.mongo.aggregate.tasks_aggregate import TaskAggregate
-from scripts.utils.mongo_util import MongoQueryBuilder
+from scripts.utils.mongo_util import MongoQueryBuilder, raw_batches_to_json
+from scripts.utils.principal_cache import Principal, principal_cache
+from scripts.utils.result_cache import result_cache
+from scripts.utils.task_events import task_event_hub
 
 
 class TaskHandler(MongoQueryBuilder):
     def __init__(self):
         self.task_mongo = TaskMongo(mongo_client=mongo_client)
         self.user_mongo = UserMongo(mongo_client=mongo_client)
+        self._fetch_context = None
 
-    def create_task(self, request_data: TaskModel, user_id: str) -> str:
+    async def create_task(self, request_data: TaskModel, user_id: str) -> str:
         """
         Creates a task using the provided request data and user ID.
         Args:
@@ -34,68 +52,416 @@ class TaskHandler(MongoQueryBuilder):
                 created_by=user_id,
                 created_at=int(datetime.now(timezone.utc).timestamp()),
             )
-            self.task_mongo.insert_one(request_data.model_dump())
+            request_data.version = 0
+            await self.task_mongo.insert_one(request_data.model_dump())
+            await result_cache.bump([request_data.assigned_to])
+            await task_event_hub.publish(
+                [
+                    self._event(
+                        "created",
+                        task_id=request_data.task_id,
+                        assignees={request_data.assigned_to},
+                        version=0,
+                        task=request_data.model_dump(),
+                    )
+                ]
+            )
             return request_data.task_id
         except Exception as e:
             logger.info(f"Error while creating task : {str(e)}")
             raise
 
-    def update_task(self, request_data: TaskModel, user_id):
+    async def update_task(self, request_data: TaskModel, user_id: str) -> int:
         """
         Updates a task with the provided data.
         Args:
-            request_data (TaskModel): The data to update the task with.
+            request_data (TaskModel): The data to update the task with. When
+                version is set the update only applies to that version.
             user_id: The ID of the user performing the update.
         Returns:
-            None
+            int: The new version of the task.
         Raises:
             CustomError: If the task_id provided in the request_data is invalid.
+            ConflictError: If the task was modified since the given version.
+        """
+        try:
+            return await self._apply_update(
+                task_id=request_data.task_id,
+                data=request_data.model_dump(exclude={"meta", "task_id", "version"}),
+                user_id=user_id,
+                version=request_data.version,
+            )
+        except Exception as e:
+            logger.info(f"Error while updating task : {str(e)}")
+            raise
+
+    async def patch_task(self, request_data: TaskPatchModel, user_id: str) -> int:
+        """
+        Updates only the fields sent in the request, provided the task is still
+        at the version the client read.
+        Args:
+            request_data (TaskPatchModel): The changed fields and expected version.
+            user_id: The ID of the user performing the update.
+        Returns:
+            int: The new version of the task.
+        Raises:
+            CustomError: If no field is sent or the task_id is invalid.
+            ConflictError: If the task was modified since the given version.
         """
         try:
-            if task_data := self.task_mongo.find_one(
-                query={"task_id": request_data.task_id}
+            data = request_data.model_dump(
+                exclude_unset=True, exclude_none=True, exclude={"task_id", "version"}
+            )
+            if not data:
+                raise CustomError("No fields to update !!")
+            return await self._apply_update(
+                task_id=request_data.task_id,
+                data=data,
+                user_id=user_id,
+                version=request_data.version,
+            )
+        except Exception as e:
+            logger.info(f"Error while patching task : {str(e)}")
+            raise
+
+    async def _apply_update(
+        self, task_id: str, data: dict, user_id: str, version: Optional[int]
+    ) -> int:
+        # meta.created_* is left untouched server-side, so one atomic call is enough.
+        query = {"task_id": task_id}
+        if version is not None:
+            # Tasks created before versioning have no version field.
+            query["version"] = version or {QueryConstants.in_: [0, None]}
+        data["meta.updated_by"] = user_id
+        data["meta.updated_at"] = int(datetime.now(timezone.utc).timestamp())
+        previous = await self.task_mongo.find_one_and_update(
+            query=query,
+            update={"$set": data, "$inc": {"version": 1}},
+            filter_dict={"_id": 0, "assigned_to": 1, "version": 1},
+        )
+        if not previous:
+            if version is not None and await self.task_mongo.find_one(
+                query={"task_id": task_id}, filter_dict={"_id": 0, "task_id": 1}
             ):
-                request_data.meta = MetaData(
-                    created_at=task_data["meta"]["created_at"],
-                    created_by=task_data["meta"]["created_by"],
-                    updated_by=user_id,
-                    updated_at=int(datetime.now(timezone.utc).timestamp()),
+                raise ConflictError(
+                    f"Task {task_id} was modified since version {version} !!"
                 )
-                self.task_mongo.update_one(
-                    query={"task_id": request_data.task_id},
-                    data=request_data.model_dump(),
+            raise CustomError("Invalid task_id !!")
+        assignees = {previous.get("assigned_to"), data.get("assigned_to")} - {None}
+        await result_cache.bump(assignees)
+        new_version = previous.get("version", 0) + 1
+        await task_event_hub.publish(
+            [
+                self._event(
+                    "updated",
+                    task_id=task_id,
+                    assignees=assignees,
+                    version=new_version,
+                    changes=data,
                 )
-            else:
-                raise CustomError("Invalid task_id !!")
+            ]
+        )
+        return new_version
+
+    @staticmethod
+    def _event(event_type: str, task_id: str, assignees: set, **fields) -> dict:
+        # Assignees include the previous one, so its subscribers see the task leave.
+        return {
+            "type": event_type,
+            "task_id": task_id,
+            "assignees": sorted(assignee for assignee in assignees if assignee),
+            **fields,
+        }
+
+    @staticmethod
+    def _check_bulk_size(request_data: list):
+        if not request_data:
+            raise CustomError("No tasks provided !!")
+        if len(request_data) > QueryConstants.max_bulk_size:
+            raise CustomError(
+                f"At most {QueryConstants.max_bulk_size} tasks are allowed per request !!"
+            )
+
+    async def bulk_create_task(
+        self, request_data: List[TaskModel], user_id: str
+    ) -> List[BulkItemResult]:
+        """
+        Creates many tasks with a single unordered bulk write.
+        Args:
+            request_data: TaskModel objects to create.
+            user_id: User ID associated with the task creation.
+        Returns:
+            List[BulkItemResult]: Outcome of every task, in request order.
+        Raises:
+            CustomError: If the batch is empty or too large.
+        """
+        try:
+            self._check_bulk_size(request_data)
+            created_at = int(datetime.now(timezone.utc).timestamp())
+            operations = []
+            for task in request_data:
+                task.task_id = shortuuid.uuid()
+                task.meta = MetaData(created_by=user_id, created_at=created_at)
+                task.version = 0
+                operations.append(InsertOne(task.model_dump()))
+            result = await self.task_mongo.bulk_write(operations)
+            await result_cache.bump({task.assigned_to for task in request_data})
+            errors = {
+                error["index"]: error.get("errmsg", "")
+                for error in result.get("writeErrors", [])
+            }
+            await task_event_hub.publish(
+                [
+                    self._event(
+                        "created",
+                        task_id=task.task_id,
+                        assignees={task.assigned_to},
+                        version=0,
+                        task=task.model_dump(),
+                    )
+                    for index, task in enumerate(request_data)
+                    if index not in errors
+                ]
+            )
+            return [
+                BulkItemResult(
+                    index=index,
+                    task_id=task.task_id,
+                    status="failure" if index in errors else "success",
+                    error=errors.get(index),
+                )
+                for index, task in enumerate(request_data)
+            ]
         except Exception as e:
-            logger.info(f"Error while creating task : {str(e)}")
+            logger.info(f"Error while bulk creating tasks : {str(e)}")
             raise
 
-    def fetch_task(self, request_data: FetchTaskModel) -> list:
+    async def bulk_update_task(
+        self, request_data: List[TaskModel], user_id: str
+    ) -> List[BulkItemResult]:
         """
-        Fetches tasks based on the provided request data.
+        Updates many tasks with a single unordered bulk write. The stored
+        meta.created_* fields are preserved server-side, so the batch needs one
+        lookup for unknown task_ids and one write. Versions are bumped but not
+        checked, use patch_task for conflict-safe edits.
         Args:
-            request_data: Data containing the user ID for fetching tasks.
+            request_data: TaskModel objects holding the new task data.
+            user_id: The ID of the user performing the update.
         Returns:
-            List: List of tasks fetched based on the request data.
+            List[BulkItemResult]: Outcome of every task, in request order.
         Raises:
-            Any Exception raised during the task fetching process.
+            CustomError: If the batch is empty or too large.
         """
         try:
-            user_data = (
-                self.user_mongo.find_one(
-                    query={"user_id": request_data.user_id},
-                    filter_dict={"group_ids": 1, "user_role": 1},
+            self._check_bulk_size(request_data)
+            task_ids = list({task.task_id for task in request_data})
+            cursor = self.task_mongo.find(
+                query={"task_id": {QueryConstants.in_: task_ids}},
+                filter_dict={"_id": 0, "task_id": 1, "assigned_to": 1},
+            )
+            existing = {
+                task["task_id"]: task.get("assigned_to") async for task in cursor
+            }
+            updated_at = int(datetime.now(timezone.utc).timestamp())
+            results, operations, positions, changes = [], [], [], []
+            for index, task in enumerate(request_data):
+                results.append(BulkItemResult(index=index, task_id=task.task_id))
+                if task.task_id not in existing:
+                    results[index].status = "failure"
+                    results[index].error = "Invalid task_id !!"
+                    continue
+                data = task.model_dump(exclude={"meta", "task_id", "version"})
+                data["meta.updated_by"] = user_id
+                data["meta.updated_at"] = updated_at
+                operations.append(
+                    UpdateOne(
+                        {"task_id": task.task_id},
+                        {"$set": data, "$inc": {"version": 1}},
+                    )
+                )
+                positions.append(index)
+                changes.append(data)
+            if operations:
+                result = await self.task_mongo.bulk_write(operations)
+                await result_cache.bump(
+                    {existing[request_data[index].task_id] for index in positions}
+                    | {request_data[index].assigned_to for index in positions}
+                )
+                for error in result.get("writeErrors", []):
+                    item = results[positions[error["index"]]]
+                    item.status = "failure"
+                    item.error = error.get("errmsg", "")
+                await task_event_hub.publish(
+                    [
+                        self._event(
+                            "updated",
+                            task_id=request_data[index].task_id,
+                            assignees={
+                                existing[request_data[index].task_id],
+                                request_data[index].assigned_to,
+                            },
+                            changes=data,
+                        )
+                        for index, data in zip(positions, changes)
+                        if results[index].status == "success"
+                    ]
                 )
-                or {}
+            return results
+        except Exception as e:
+            logger.info(f"Error while bulk updating tasks : {str(e)}")
+            raise
+
+    async def resolve_principal(self, user_id: str) -> Principal:
+        """
+        Resolves the role and groups of the requesting user.
+        Args:
+            user_id: ID of the requesting user.
+        Returns:
+            Principal: Role and group ids of the user.
+        """
+        return await principal_cache.get(
+            user_id,
+            loader=lambda: self.user_mongo.find_one(
+                query={"user_id": user_id},
+                filter_dict={"_id": 0, "group_ids": 1, "user_role": 1},
+            ),
+        )
+
+    def build_pipeline(
+        self, request_data: FetchTaskModel, principal: Principal
+    ) -> list:
+        """
+        Builds the aggregate pipeline for the tasks visible to the requesting user.
+        Args:
+            request_data: Data containing the user ID, filters and paging.
+            principal: Role and groups of the requesting user.
+        Returns:
+            list: Aggregate pipeline for the tasks collection.
+        """
+        query = TaskAggregate.fetch_tasks(
+            user_ids=principal.scope, role=principal.user_role
+        )
+        return self.add_filters(query=query, input_data=request_data)
+
+    async def stream_task(self, request_data: FetchTaskModel) -> AsyncIterator[bytes]:
+        """
+        Resolves the fetch pipeline and returns an iterator that streams the
+        matching tasks as NDJSON, one cursor batch at a time. Paging fields are
+        ignored since the stream already covers the full result.
+        Args:
+            request_data: Data containing the user ID and filters.
+        Returns:
+            AsyncIterator[bytes]: NDJSON chunks, one line per task.
+        Raises:
+            Any Exception raised while resolving the pipeline.
+        """
+        try:
+            pipeline = self.build_pipeline(
+                request_data.model_copy(update={"page_size": None, "cursor": None}),
+                principal=await self.resolve_principal(request_data.user_id),
             )
-            user_ids = user_data.get("group_ids", []) or []
-            user_ids.append(request_data.user_id)
-            query = TaskAggregate.fetch_tasks(
-                user_ids=user_ids, role=user_data.get("user_role", "").lower()
+            cursor = self.task_mongo.aggregate(
+                pipelines=pipeline, batch_size=QueryConstants.stream_batch_size
+            )
+            return self._stream_cursor(cursor)
+        except Exception as e:
+            logger.info(f"Error while streaming task : {str(e)}")
+            raise
+
+    @staticmethod
+    async def _stream_cursor(cursor) -> AsyncIterator[bytes]:
+        batch = []
+        try:
+            async for document in cursor:
+                batch.append(orjson.dumps(document, default=str))
+                if len(batch) >= QueryConstants.stream_batch_size:
+                    yield b"\n".join(batch) + b"\n"
+                    batch = []
+            if batch:
+                yield b"\n".join(batch) + b"\n"
+        except Exception as e:
+            logger.info(f"Error while streaming task : {str(e)}")
+            raise
+        finally:
+            await cursor.close()
+
+    async def _prepare_fetch(
+        self, request_data: FetchTaskModel
+    ) -> Tuple[list, Optional[str]]:
+        # The ETag check and the fetch of one request share the pipeline and key.
+        if self._fetch_context is None or self._fetch_context[0] is not request_data:
+            principal = await self.resolve_principal(request_data.user_id)
+            pipeline = self.build_pipeline(request_data, principal=principal)
+            cache_key = await result_cache.key_for(
+                pipeline, scope=None if principal.is_admin else principal.scope
             )
-            pipeline = self.add_filters(query=query, input_data=request_data)
-            if task_data := list(self.task_mongo.aggregate(pipelines=pipeline)):
+            self._fetch_context = (request_data, pipeline, cache_key)
+        return self._fetch_context[1], self._fetch_context[2]
+
+    async def fetch_version(self, request_data: FetchTaskModel) -> str:
+        """
+        Computes a version tag for the result of a fetch without loading the
+        tasks. With the result cache the tag derives from its key, which changes
+        with every write the view can see, so no query is made. Otherwise it hashes
+        the pipeline with the count, the sum of versions and the latest
+        created/updated times of the tasks matching the scope and filters.
+        Args:
+            request_data: Data containing the user ID, filters and paging.
+        Returns:
+            str: Quoted entity tag for the ETag header.
+        Raises:
+            Any Exception raised while resolving the pipeline or the version.
+        """
+        try:
+            pipeline, cache_key = await self._prepare_fetch(request_data)
+            if cache_key is not None:
+                return result_cache.entity_tag(cache_key)
+            cursor = self.task_mongo.aggregate(
+                pipelines=[pipeline[0], TaskAggregate.version_group()]
+            )
+            version = await cursor.to_list(length=1)
+            digest = hashlib.sha1(orjson.dumps(pipeline, default=str))
+            digest.update(orjson.dumps(version, default=str))
+            return f'"{digest.hexdigest()}"'
+        except Exception as e:
+            logger.info(f"Error while computing task version : {str(e)}")
+            raise
+
+    async def _fetch_json(self, pipeline: list, cache_key: Optional[str]) -> Fragment:
+        task_json = result_cache.get_json(cache_key)
+        if task_json is None:
+            cursor = self.task_mongo.aggregate(pipelines=pipeline, raw_batches=True)
+            task_json = await raw_batches_to_json(cursor)
+            result_cache.set_json(cache_key, task_json)
+        return Fragment(task_json)
+
+    async def fetch_task(
+        self, request_data: FetchTaskModel
+    ) -> list | TaskPageModel | Fragment:
+        """
+        Fetches tasks based on the provided request data.
+        Args:
+            request_data: Data containing the user ID for fetching tasks.
+        Returns:
+            List: List of tasks fetched based on the request data, or a
+            TaskPageModel with the next cursor when page_size is set. With
+            RAW_BSON_READS, unpaged results are a pre-serialised orjson Fragment
+            that only routes using ORJSONEnvelopeRoute can render.
+        Raises:
+            Any Exception raised during the task fetching process.
+        """
+        try:
+            pipeline, cache_key = await self._prepare_fetch(request_data)
+            if Mongo.RAW_BSON_READS and not request_data.page_size:
+                return await self._fetch_json(pipeline, cache_key)
+            task_data = result_cache.get(cache_key)
+            if task_data is None:
+                cursor = self.task_mongo.aggregate(pipelines=pipeline)
+                task_data = await cursor.to_list(length=None)
+                result_cache.set(cache_key, task_data)
+            if request_data.page_size:
+                return self.paginate(task_data, input_data=request_data)
+            if task_data:
                 return task_data
             logger.debug("No data found")
             return []
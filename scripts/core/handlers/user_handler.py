@@ -7,6 +7,7 @@ from scripts.core.schemas.user_model import UserUpdateModel, CreateGroupModel
 from scripts.exceptions.module_exception import CustomError
 from scripts.logging import logger
 from scripts.utils.mongo_util import MongoQueryBuilder
+from scripts.utils.principal_cache import principal_cache
 
 
 class UserHandler(MongoQueryBuilder):
@@ -14,7 +15,7 @@ class UserHandler(MongoQueryBuilder):
         self.users_collection = UserMongo(mongo_client=mongo_client)
         self.groups_collection = GroupMongo(mongo_client=mongo_client)
 
-    def update_user_info(self, request_data: UserUpdateModel, user_id):
+    async def update_user_info(self, request_data: UserUpdateModel, user_id):
         """
         Updates user information based on the provided UserUpdateModel object.
         Args:
@@ -26,7 +27,7 @@ class UserHandler(MongoQueryBuilder):
             CustomError: If the user is unknown or any other Exception occurs during the update process.
         """
         try:
-            if self.users_collection.find_one(
+            if await self.users_collection.find_one(
                 {
                     "username": request_data.username,
                     "user_id": {"$ne": request_data.user_id},
@@ -35,19 +36,20 @@ class UserHandler(MongoQueryBuilder):
             ):
                 raise CustomError("Username already exists!!")
 
-            if self.users_collection.find_one(
+            if await self.users_collection.find_one(
                 {"user_id": user_id}, filter_dict={"_id": 0, "user_id": 1}
             ):
-                self.users_collection.update_one(
+                await self.users_collection.update_one(
                     query={"user_id": user_id}, data=request_data.model_dump()
                 )
+                await principal_cache.invalidate(user_id)
                 return
             raise CustomError("Unknown User !!")
         except Exception as e:
             logger.info(f"Failed to update user info : {str(e)}")
             raise
 
-    def create_groups(self, request_data: CreateGroupModel) -> str:
+    async def create_groups(self, request_data: CreateGroupModel) -> str:
         """
         Creates a new group using the provided CreateGroupModel object.
         Args:
@@ -59,7 +61,7 @@ class UserHandler(MongoQueryBuilder):
         """
         try:
             request_data.group_id = shortuuid.uuid()
-            self.groups_collection.insert_one(request_data.model_dump())
+            await self.groups_collection.insert_one(request_data.model_dump())
             return request_data.group_id
         except Exception as e:
             logger.info(f"Failed to create groups : {str(e)}")
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from scripts.config.constants import QueryConstants
 
 
 class MetaData(BaseModel):
@@ -19,13 +21,43 @@ class TaskModel(BaseModel):
     due_date: int
     comments: Optional[str] = ""
     status: Optional[str] = "Open"
+    version: Optional[int] = None
+
+
+class TaskPatchModel(BaseModel):
+    task_id: str
+    version: int = Field(ge=0)
+    title: Optional[str] = None
+    description: Optional[str] = None
+    assigned_to: Optional[str] = None
+    due_date: Optional[int] = None
+    comments: Optional[str] = None
+    status: Optional[str] = None
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    task_id: Optional[str] = ""
+    status: str = "success"
+    error: Optional[str] = None
 
 
 class FilterModel(BaseModel):
     filterModel: Optional[dict] = {}
     sortModel: Optional[list] = []
+    search: Optional[str] = ""
 
 
 class FetchTaskModel(BaseModel):
     user_id: str
     filters: Optional[FilterModel] = FilterModel()
+    page_size: Optional[int] = Field(
+        default=None, ge=1, le=QueryConstants.max_page_size
+    )
+    cursor: Optional[str] = None
+    stream: Optional[bool] = False
+
+
+class TaskPageModel(BaseModel):
+    records: list = []
+    next_cursor: Optional[str] = None
@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+
+from scripts.api import Endpoints
+from scripts.core.handlers.health_handler import HealthHandler
+
+health_router = APIRouter()
+
+
+@health_router.get(Endpoints.api_healthz, include_in_schema=False)
+async def healthz():
+    """
+    Liveness: the worker serves requests. Makes no round trip to Mongo or Redis.
+    """
+    return ORJSONResponse({"status": "ok", "pools": HealthHandler().pools()})
+
+
+@health_router.get(Endpoints.api_readyz, include_in_schema=False)
+async def readyz():
+    """
+    Readiness: Mongo and Redis answer a ping; 503 otherwise.
+    """
+    readiness = await HealthHandler().readiness()
+    ready = readiness.pop("ready")
+    return ORJSONResponse(
+        {"status": "ready" if ready else "not_ready", **readiness},
+        status_code=200 if ready else 503,
+    )
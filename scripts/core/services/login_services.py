@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -6,6 +6,7 @@ from scripts.api import Endpoints
 from scripts.core.handlers.login_handler import LoginHandler
 from scripts.core.schemas import DefaultResponseSchema, DefaultFailureSchema
 from scripts.core.schemas.auth_model import UserModel, LoginModel
+from scripts.exceptions.module_exception import PoolSaturatedError
 from scripts.utils.authorisation import MetaInfoSchema
 
 login_router = APIRouter(prefix=Endpoints.api_auth)
@@ -15,7 +16,13 @@ login_router = APIRouter(prefix=Endpoints.api_auth)
 async def sign_up(user: UserModel):
     try:
         login_handler = LoginHandler()
-        return DefaultResponseSchema(data=login_handler.create_user(user))
+        return DefaultResponseSchema(data=await login_handler.create_user(user))
+    except PoolSaturatedError as pe:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(pe),
+            headers={"Retry-After": "1"},
+        ) from pe
     except Exception as e:
         return DefaultFailureSchema(message="Failed to signup", error=str(e))
 
@@ -25,11 +32,17 @@ async def login(request_data: LoginModel, request: Request, response: Response):
     try:
         login_handler = LoginHandler()
         return DefaultResponseSchema(
-            data=login_handler.authenticate_user(
+            data=await login_handler.authenticate_user(
                 request=request, response=response, request_data=request_data
             ),
             message=f"Successfully logged in as {request_data.username}",
         )
+    except PoolSaturatedError as pe:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(pe),
+            headers={"Retry-After": "1"},
+        ) from pe
     except Exception as e:
         return DefaultFailureSchema(message="Failed to login", error=str(e))
 
@@ -39,7 +52,7 @@ async def logout(meta: MetaInfoSchema):
     try:
         login_handler = LoginHandler()
         return DefaultResponseSchema(
-            data=login_handler.logout(user_id=meta.user_id),
+            data=await login_handler.logout(user_id=meta.user_id),
             message="Successfully logged out",
         )
     except Exception as e:
@@ -0,0 +1,33 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from scripts.api import Endpoints
+from scripts.utils.activity_buffer import activity_buffer
+from scripts.utils.metrics_util import metrics, stats_gauges
+from scripts.utils.password_util import password_hasher
+from scripts.utils.principal_cache import principal_cache
+from scripts.utils.result_cache import result_cache
+from scripts.utils.session_cache import session_cache
+from scripts.utils.task_events import task_event_hub
+
+metrics_router = APIRouter()
+
+stats_gauges(
+    "component_stats",
+    "Cache, buffer and pool statistics of this worker.",
+    {
+        "session_cache": session_cache.stats,
+        "principal_cache": principal_cache.stats,
+        "result_cache": result_cache.stats,
+        "activity_buffer": activity_buffer.stats,
+        "password_hasher": password_hasher.stats,
+        "task_subscribers": task_event_hub.stats,
+    },
+)
+
+
+@metrics_router.get(Endpoints.api_metrics, include_in_schema=False)
+async def get_metrics():
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
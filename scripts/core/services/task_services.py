@@ -1,12 +1,22 @@
-from fastapi import APIRouter
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, WebSocket, status
+from fastapi.responses import Response, StreamingResponse
+from starlette.requests import Request
 
 from scripts.api import Endpoints
+from scripts.config.constants import QueryConstants
 from scripts.core.handlers.task_handler import TaskHandler
 from scripts.core.schemas import DefaultResponseSchema, DefaultFailureSchema
-from scripts.core.schemas.task_model import TaskModel, FetchTaskModel
-from scripts.utils.authorisation import MetaInfoSchema
+from scripts.core.schemas.task_model import TaskModel, TaskPatchModel, FetchTaskModel
+from scripts.exceptions.module_exception import ConflictError
+from scripts.logging import logger
+from scripts.utils.authorisation import CookieAuthentication, MetaInfoSchema
+from scripts.utils.principal_cache import Principal
+from scripts.utils.response_util import ORJSONEnvelopeRoute
+from scripts.utils.task_events import task_event_hub
 
-task_router = APIRouter(prefix=Endpoints.api_task)
+task_router = APIRouter(prefix=Endpoints.api_task, route_class=ORJSONEnvelopeRoute)
 
 
 @task_router.post(Endpoints.api_create)
@@ -14,7 +24,7 @@ async def create_task(request_data: TaskModel, meta: MetaInfoSchema):
     try:
         task_handler = TaskHandler()
         return DefaultResponseSchema(
-            data=task_handler.create_task(request_data, user_id=meta.user_id)
+            data=await task_handler.create_task(request_data, user_id=meta.user_id)
         )
     except Exception as e:
         return DefaultFailureSchema(message="Failed to create task", error=str(e))
@@ -25,16 +35,122 @@ async def update_task(request_data: TaskModel, meta: MetaInfoSchema):
     try:
         task_handler = TaskHandler()
         return DefaultResponseSchema(
-            data=task_handler.update_task(request_data, user_id=meta.user_id)
+            data=await task_handler.update_task(request_data, user_id=meta.user_id)
+        )
+    except ConflictError as ce:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(ce)
+        ) from ce
+    except Exception as e:
+        return DefaultFailureSchema(message="Failed to update task", error=str(e))
+
+
+@task_router.patch(Endpoints.api_update)
+async def patch_task(request_data: TaskPatchModel, meta: MetaInfoSchema):
+    try:
+        task_handler = TaskHandler()
+        return DefaultResponseSchema(
+            data=await task_handler.patch_task(request_data, user_id=meta.user_id)
         )
+    except ConflictError as ce:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(ce)
+        ) from ce
     except Exception as e:
         return DefaultFailureSchema(message="Failed to update task", error=str(e))
 
 
+@task_router.post(Endpoints.api_bulk_create)
+async def bulk_create_task(request_data: List[TaskModel], meta: MetaInfoSchema):
+    try:
+        task_handler = TaskHandler()
+        return DefaultResponseSchema(
+            data=await task_handler.bulk_create_task(request_data, user_id=meta.user_id)
+        )
+    except Exception as e:
+        return DefaultFailureSchema(message="Failed to create tasks", error=str(e))
+
+
+@task_router.post(Endpoints.api_bulk_update)
+async def bulk_update_task(request_data: List[TaskModel], meta: MetaInfoSchema):
+    try:
+        task_handler = TaskHandler()
+        return DefaultResponseSchema(
+            data=await task_handler.bulk_update_task(request_data, user_id=meta.user_id)
+        )
+    except Exception as e:
+        return DefaultFailureSchema(message="Failed to update tasks", error=str(e))
+
+
 @task_router.post(Endpoints.api_fetch)
-async def fetch_task(request_data: FetchTaskModel, meta: MetaInfoSchema):
+async def fetch_task(
+    request_data: FetchTaskModel,
+    request: Request,
+    response: Response,
+    meta: MetaInfoSchema,
+):
     try:
         task_handler = TaskHandler()
-        return DefaultResponseSchema(data=task_handler.fetch_task(request_data))
+        accept = request.headers.get("accept", "")
+        if request_data.stream or QueryConstants.ndjson_media_type in accept:
+            return _with_headers(
+                StreamingResponse(
+                    await task_handler.stream_task(request_data),
+                    media_type=QueryConstants.ndjson_media_type,
+                ),
+                response,
+            )
+        etag = await task_handler.fetch_version(request_data)
+        if _etag_matches(
+            request.headers.get(QueryConstants.if_none_match_header), etag
+        ):
+            return _with_headers(
+                Response(status_code=304, headers={QueryConstants.etag_header: etag}),
+                response,
+            )
+        task_data = await task_handler.fetch_task(request_data)
+        # Only successful results are tagged, a failure must not be revalidated.
+        response.headers[QueryConstants.etag_header] = etag
+        return DefaultResponseSchema(data=task_data)
     except Exception as e:
         return DefaultFailureSchema(message="Failed to fetch task", error=str(e))
+
+
+def _with_headers(response: Response, sub_response: Response) -> Response:
+    """
+    FastAPI only merges the headers of the injected response, such as the
+    session cookie refreshed by CookieAuthentication, into responses it builds
+    itself; a response returned as is must carry them over.
+    """
+    response.headers.raw.extend(sub_response.headers.raw)
+    return response
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+@task_router.websocket(Endpoints.api_subscribe)
+async def subscribe_tasks(websocket: WebSocket):
+    task_handler = TaskHandler()
+
+    async def resolve(record_activity: bool = True) -> Principal:
+        user_id = await CookieAuthentication.authenticate(
+            websocket, record_activity=record_activity
+        )
+        return await task_handler.resolve_principal(user_id)
+
+    try:
+        principal = await resolve()
+    except Exception as e:
+        logger.info(f"Rejected task subscription : {str(e)}")
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    # An open socket must not keep its session alive past the lock-out time.
+    await task_event_hub.serve(
+        websocket, principal, revalidate=lambda: resolve(record_activity=False)
+    )
@@ -15,7 +15,7 @@ async def update_user_info(request_data: UserUpdateModel, meta: MetaInfoSchema):
     try:
         user_handler = UserHandler()
         return DefaultResponseSchema(
-            data=user_handler.update_user_info(
+            data=await user_handler.update_user_info(
                 request_data=request_data, user_id=meta.user_id
             ),
             message=f"Successfully updated the user {meta.user_id}",
@@ -31,7 +31,7 @@ async def create_groups(request_data: CreateGroupModel, meta: MetaInfoSchema):
     try:
         user_handler = UserHandler()
         return DefaultResponseSchema(
-            data=user_handler.create_groups(request_data=request_data),
+            data=await user_handler.create_groups(request_data=request_data),
             message="Successfully created the group",
         )
     except CustomError as ce:
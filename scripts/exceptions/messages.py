@@ -3,3 +3,4 @@ class ErrorMessages:
     ERROR003 = "Signature Not Valid"
     ERROR002 = "Signature Expired"
     ERROR001 = "Authentication Failed, Please verify token"
+    ERROR004 = "Server busy, please retry shortly"
@@ -8,3 +8,11 @@ class AuthenticationError(Exception):
 
 class CustomError(Exception):
     pass
+
+
+class PoolSaturatedError(Exception):
+    pass
+
+
+class ConflictError(Exception):
+    pass
@@ -1,46 +1,183 @@
+import atexit
 import logging
+import os
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+import orjson
 
-def setup_logger(name, log_file, level=logging.DEBUG):
+from scripts.config import Logging, Services
+
+TEXT_FORMAT = (
+    "%(asctime)s - %(levelname)-6s - [%(threadName)5s:%(funcName)5s("
+    "): %(lineno)s] "
+    "- %(message)s "
+)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats a record as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keeps only a `rate` fraction of DEBUG records; other levels always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without ever blocking the caller.
+    Records are dropped, and counted, while `max_size` records are pending.
     """
-    Function to set up a logger; creates handlers for both console and file output.
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_size: int):
+        super().__init__(log_queue)
+        self.max_size = max_size
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the arguments are merged here; formatting runs on the listener.
+        # The record is not copied: this handler is the logger's only one.
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() < self.max_size:
+            self.queue.put_nowait(record)
+        else:
+            self.dropped += 1
+
+
+class LogWriter:
+    """
+    Writes queued records to the console and a size-rotated file on a
+    background thread. The handlers and the thread are created with the first
+    record rather than at import; `stop()` flushes what is pending and a later
+    record starts the thread again. With several workers each process writes
+    its own file, suffixed with its pid, since RotatingFileHandler cannot share
+    a file between processes.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, log_file: str):
+        self.log_queue = log_queue
+        self.log_file = log_file
+        self.running = False
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def _file_name(self) -> str:
+        if Services.WORKERS <= 1:
+            return self.log_file
+        root, extension = os.path.splitext(self.log_file)
+        return f"{root}.{os.getpid()}{extension}"
+
+    def _create_listener(self) -> QueueListener:
+        # Create handlers, they only ever run on the listener thread
+        c_handler = logging.StreamHandler()
+        f_handler = RotatingFileHandler(
+            self._file_name(),
+            maxBytes=Logging.LOG_MAX_BYTES,
+            backupCount=Logging.LOG_BACKUP_COUNT,
+            delay=True,
+        )
+
+        # Create formatters and add them to handlers
+        if Logging.LOG_FORMAT == "json":
+            log_format = JSONFormatter()
+        else:
+            log_format = logging.Formatter(TEXT_FORMAT)
+
+        c_handler.setFormatter(log_format)
+        f_handler.setFormatter(log_format)
+        return QueueListener(self.log_queue, c_handler, f_handler)
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            if self._listener is None:
+                self._listener = self._create_listener()
+                # Flushes the queued records on interpreter exit
+                atexit.register(self.stop)
+            self._listener.start()
+            self.running = True
+
+    def stop(self) -> None:
+        with self._lock:
+            if self.running:
+                self._listener.stop()
+                self.running = False
+
+
+class _LazyQueueHandler(NonBlockingQueueHandler):
+    def __init__(self, log_queue: queue.SimpleQueue, max_size: int, writer: LogWriter):
+        super().__init__(log_queue, max_size)
+        self.writer = writer
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if not self.writer.running:
+            self.writer.start()
+        super().enqueue(record)
+
+
+def setup_logger(name, log_file, level=Logging.LOG_LEVEL):
+    """
+    Function to set up a logger; records are queued by the caller and written to
+    the console and a size-rotated file by a background thread, which starts
+    with the first record.
 
     Args:
         name (str): Name of the logger.
         log_file (str): File to log messages.
-        level (int): Logging level (default is logging. DEBUG).
+        level (int | str): Logging level (default is LOG_LEVEL from settings).
 
     Returns:
-        logging.Logger: Configured logger.
+        Tuple[logging.Logger, LogWriter]: Configured logger and its writer.
     """
 
     # Create a custom logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Create handlers
-    c_handler = logging.StreamHandler()
-    f_handler = logging.FileHandler(log_file)
-
-    # Set level for handlers
-    c_handler.setLevel(level)
-    f_handler.setLevel(level)
-
-    # Create formatters and add them to handlers
-    log_format = logging.Formatter(
-        "%(asctime)s - %(levelname)-6s - [%(threadName)5s:%(funcName)5s("
-        "): %(lineno)s] "
-        "- %(message)s "
+    # Producers only enqueue, the writer thread formats and writes
+    log_queue = queue.SimpleQueue()
+    writer = LogWriter(log_queue, log_file)
+    q_handler = _LazyQueueHandler(
+        log_queue, max_size=Logging.LOG_QUEUE_SIZE, writer=writer
     )
+    if Logging.LOG_DEBUG_SAMPLE_RATE < 1:
+        q_handler.addFilter(DebugSampler(Logging.LOG_DEBUG_SAMPLE_RATE))
+    logger.addHandler(q_handler)
 
-    c_handler.setFormatter(log_format)
-    f_handler.setFormatter(log_format)
-
-    # Add handlers to the logger
-    logger.addHandler(c_handler)
-    logger.addHandler(f_handler)
-
-    return logger
+    return logger, writer
 
 
-logger = setup_logger("my_logger", "application.log")
+logger, log_writer = setup_logger("my_logger", Logging.LOG_FILE)
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Dict, Optional
+
+from scripts.config import Session
+from scripts.logging import logger
+from scripts.utils.session_store import session_store
+
+
+class ActivityBuffer:
+    """
+    Write-behind buffer for session last_active timestamps. Requests only
+    record the latest activity per login token in memory; changed tokens are
+    flushed to Redis in one pipelined batch every `flush_interval` seconds or
+    once `max_pending` tokens are waiting. Other workers therefore see
+    last_active at most `flush_interval` seconds late, which is the lock-out
+    tolerance.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = Session.ACTIVITY_FLUSH_INTERVAL_SECS,
+        max_pending: int = Session.ACTIVITY_FLUSH_MAX_PENDING,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = 1 if flush_interval <= 0 else max_pending
+        self._pending: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, login_token: str, last_active: int) -> None:
+        """
+        Records activity for a login token, flushing early when the buffer is full.
+        Args:
+            login_token: Login token of the session.
+            last_active: Activity time in epoch milliseconds.
+        """
+        if last_active > self._pending.get(login_token, 0):
+            self._pending[login_token] = last_active
+        if len(self._pending) >= self.max_pending and self._flushing is None:
+            self._flushing = asyncio.get_running_loop().create_task(self._drain())
+
+    def get(self, login_token: str) -> int:
+        """
+        Returns the buffered, not yet flushed, activity of a login token or 0.
+        """
+        return self._pending.get(login_token, 0)
+
+    def discard(self, login_token: str) -> None:
+        self._pending.pop(login_token, None)
+
+    async def flush(self) -> bool:
+        """
+        Writes every buffered token to Redis in a single pipeline.
+        Returns:
+            bool: False if the write failed and the batch was put back.
+        """
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return True
+        try:
+            await session_store.touch_many(batch)
+            return True
+        except Exception as e:
+            logger.exception(f"Failed to flush session activity : {str(e)}")
+            for login_token, last_active in batch.items():
+                if last_active > self._pending.get(login_token, 0):
+                    self._pending[login_token] = last_active
+            return False
+
+    async def _drain(self) -> None:
+        try:
+            while len(self._pending) >= self.max_pending:
+                if not await self.flush():
+                    break
+        finally:
+            self._flushing = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        if self.flush_interval > 0 and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {"pending": len(self._pending), "max_pending": self.max_pending}
+
+
+activity_buffer = ActivityBuffer()
@@ -1,18 +1,21 @@
 from datetime import datetime, timezone
-from typing import Annotated, Tuple
+from typing import Annotated, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.openapi.models import APIKey, APIKeyIn
 from fastapi.security.api_key import APIKeyBase
 from pydantic import BaseModel, Field
+from starlette.requests import HTTPConnection
 
 from scripts.config import Services
 from scripts.config.constants import Secrets
-from scripts.core.db.redis import login_db
 from scripts.exceptions.messages import ErrorMessages
 from scripts.logging import logger
+from scripts.utils.activity_buffer import activity_buffer
 from scripts.utils.create_token import create_token
 from scripts.utils.jwt import JWT
+from scripts.utils.session_cache import CachedSession, session_cache
+from scripts.utils.session_store import session_store
 
 
 class _MetaInfoSchema(BaseModel):
@@ -38,11 +41,13 @@ class _CookieAuthentication(APIKeyBase):
         self.model: APIKey = APIKey(**{"in": APIKeyIn.cookie}, name=cookie_name)
         self.scheme_name = self.__class__.__name__
         self.cookie_name = cookie_name
-        self.login_redis = login_db
+        self.session_store = session_store
+        self.session_cache = session_cache
+        self.activity_buffer = activity_buffer
         self.jwt = JWT()
 
-    def token_validation(
-        self, jwt_token: dict, login_token: str, host: str
+    async def token_validation(
+        self, jwt_token: dict, login_token: str, host: str, record_activity: bool = True
     ) -> Tuple[str, str]:
         """
         Validates a token for user authorization and refreshes it if necessary.
@@ -50,6 +55,8 @@ class _CookieAuthentication(APIKeyBase):
             jwt_token: Dictionary containing JWT tokens.
             login_token: Login token for the user.
             host: Host information for the token validation.
+            record_activity: Whether the check counts as user activity. Without
+                it the session is neither refreshed nor kept alive.
         Returns:
             Tuple[str, str]: User ID extracted from the token.
         Raises:
@@ -63,38 +70,67 @@ class _CookieAuthentication(APIKeyBase):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
         _token = decoded_token.get("token")
         _age = int(decoded_token.get("age", Secrets.LOCK_OUT_TIME_MINS))
+        last_active = max(
+            int(jwt_token.get("last_active")), self.activity_buffer.get(login_token)
+        )
         time_diff = (
             datetime.now(timezone.utc)
-            - datetime.fromtimestamp(
-                int(jwt_token.get("last_active")) / 1000, tz=timezone.utc
-            )
+            - datetime.fromtimestamp(last_active / 1000, tz=timezone.utc)
         ).total_seconds() / 60
 
         if time_diff > Secrets.LOCK_OUT_TIME_MINS:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        elif not record_activity:
+            return decoded_token.get("user_id")
         elif not decoded_refresh_token:
             try:
-                new_token = create_token(
+                await create_token(
                     user_id=decoded_token.get("user_id"),
                     ip=host,
                     token=_token,
                     age=_age,
                     login_token=login_token,
                 )
-                logger.debug(f"Token : {new_token}")
+                logger.debug("Refreshed token of user %s", decoded_token.get("user_id"))
                 return decoded_token.get("user_id")
             except Exception as e:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED, detail=e.args
                 ) from e
-        login_db.hset(
+        last_active = int(datetime.now(timezone.utc).timestamp() * 1000)
+        self.activity_buffer.record(login_token, last_active)
+        self.session_cache.set(
             login_token,
-            mapping={
-                "last_active": int(datetime.now(timezone.utc).timestamp() * 1000),
-            },
+            user_id=decoded_token.get("user_id"),
+            expires_at=decoded_token.get("exp", 0),
+            last_active=last_active,
         )
         return decoded_token.get("user_id")
 
+    def cached_validation(
+        self, session: CachedSession, login_token: str, record_activity: bool = True
+    ) -> Optional[str]:
+        """
+        Validates a request against a session cached by an earlier token_validation,
+        skipping the Redis read and JWT decoding.
+        Args:
+            session: Cached session for the login token.
+            login_token: Login token for the user.
+            record_activity: Whether the check counts as user activity.
+        Returns:
+            Optional[str]: User ID of the cached session, or None if the cached
+            activity is past the lock-out time and the session must be re-validated
+            against Redis (the user may have been active on another worker).
+        """
+        last_active = int(datetime.now(timezone.utc).timestamp() * 1000)
+        if (last_active - session.last_active) / 60000 > Secrets.LOCK_OUT_TIME_MINS:
+            self.session_cache.discard(login_token)
+            return None
+        if record_activity:
+            self.activity_buffer.record(login_token, last_active)
+            session.last_active = last_active
+        return session.user_id
+
     @staticmethod
     async def update_headers_and_cookies(response: Response, login_token: str) -> None:
         """
@@ -114,6 +150,63 @@ class _CookieAuthentication(APIKeyBase):
             max_age=Secrets.LOCK_OUT_TIME_MINS * 60,
         )
 
+    def login_token(self, connection: HTTPConnection) -> Optional[str]:
+        return connection.cookies.get(self.cookie_name) or connection.headers.get(
+            self.cookie_name
+        )
+
+    async def authenticate(
+        self, connection: HTTPConnection, record_activity: bool = True
+    ) -> str:
+        """
+        Resolves the user of an incoming request or websocket from its login token.
+        Args:
+            connection: Request or WebSocket carrying the token as cookie or header.
+            record_activity: Whether the check counts as user activity. Open
+                websockets re-check their session without keeping it alive.
+        Returns:
+            str: User ID of the session.
+        Raises:
+            HTTPException: If the token is missing, expired or invalid.
+        """
+        if not Services.SECURE_ACCESS:
+            return connection.cookies.get("user_id", connection.headers.get("user_id"))
+        login_token = self.login_token(connection)
+        if not login_token:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+        user_id = None
+        if session := self.session_cache.get(login_token):
+            user_id = self.cached_validation(
+                session=session,
+                login_token=login_token,
+                record_activity=record_activity,
+            )
+        jwt_token = None if user_id else await self.session_store.get(login_token)
+
+        if not user_id and not jwt_token:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        try:
+            if not user_id:
+                user_id = await self.token_validation(
+                    jwt_token=jwt_token,
+                    login_token=login_token,
+                    host=connection.client.host if connection.client else "0.0.0.0",
+                    record_activity=record_activity,
+                )
+        except Exception as e:
+            logger.exception(e)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=ErrorMessages.UNKNOWN_ERROR,
+            ) from e
+        if not user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token doesn't have required fields",
+            )
+        return user_id
+
     async def __call__(self, request: Request, response: Response) -> _MetaInfoSchema:
         """
         Handles the authorization process for incoming requests by validating tokens and updating headers and cookies.
@@ -125,40 +218,10 @@ class _CookieAuthentication(APIKeyBase):
         Raises:
             HTTPException: If authorization fails or an unknown error occurs during the process.
         """
-        cookies = request.cookies
-        login_token = cookies.get(self.cookie_name) or request.headers.get(
-            self.cookie_name
-        )
+        user_id = await self.authenticate(request)
+        login_token = self.login_token(request)
         if Services.SECURE_ACCESS:
-            if not login_token:
-                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-
-            jwt_token = self.login_redis.hgetall(login_token)
-
-            if not jwt_token:
-                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
-            try:
-                user_id = self.token_validation(
-                    jwt_token=jwt_token,
-                    login_token=login_token,
-                    host=request.client.host if request.client else "0.0.0.0",
-                )
-                await self.update_headers_and_cookies(response, login_token)
-            except Exception as e:
-                logger.exception(e)
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=ErrorMessages.UNKNOWN_ERROR,
-                ) from e
-            logger.debug(login_token)
-            if not user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token doesn't have required fields",
-                )
-            user_id = user_id
-        else:
-            user_id = cookies.get("user_id", request.headers.get("user_id"))
+            await self.update_headers_and_cookies(response, login_token)
         new_token = login_token
         return _MetaInfoSchema(
             user_id=user_id,
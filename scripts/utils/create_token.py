@@ -2,12 +2,13 @@ import uuid
 from datetime import datetime, timezone, timedelta
 
 from scripts.config.constants import Secrets
-from scripts.core.db.redis import login_db
 from scripts.exceptions.module_exception import CustomError
 from scripts.utils.jwt import JWT
+from scripts.utils.session_cache import session_cache
+from scripts.utils.session_store import session_store
 
 
-def create_token(
+async def create_token(
     user_id,
     ip,
     token,
@@ -46,20 +47,19 @@ def create_token(
         _payload = refresh_token_payload | _extras
         refresh_token = jwt.encode(_payload)
 
-        login_db.hset(
+        await session_store.create(
             uid,
             mapping={
                 "access_token": access_token,
                 "refresh_token": refresh_token,
                 "last_active": int(datetime.now(timezone.utc).timestamp() * 1000),
             },
-        )
-        login_db.expire(
-            uid,
-            timedelta(
+            ttl=timedelta(
                 minutes=(Secrets.REFRESH_TIME_IN_MINS + age + Secrets.LEEWAY_IN_MINS)
             ),
         )
+        if login_token:
+            await session_cache.invalidate(uid)
 
         return uid
     except Exception as e:
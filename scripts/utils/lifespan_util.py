@@ -0,0 +1,48 @@
+import inspect
+from typing import Any, Callable, Optional
+
+
+class LazyResource:
+    """
+    Stands in for a client whose connection pool belongs to one worker process.
+    The client is built by `open()` from the app lifespan, after the worker has
+    started, or on first use outside of it (CLI scripts, benchmarks), and is
+    released by `close()`. Attribute and item access are forwarded to it, so
+    modules can keep importing the resource at import time.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], closer: Callable):
+        self.name = name
+        self.factory = factory
+        self.closer = closer
+        self._resource: Optional[Any] = None
+
+    @property
+    def resource(self) -> Any:
+        if self._resource is None:
+            self._resource = self.factory()
+        return self._resource
+
+    @property
+    def is_open(self) -> bool:
+        return self._resource is not None
+
+    def open(self) -> Any:
+        return self.resource
+
+    async def close(self) -> None:
+        if self._resource is None:
+            return
+        resource, self._resource = self._resource, None
+        result = self.closer(resource)
+        if inspect.isawaitable(result):
+            await result
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.resource, item)
+
+    def __getitem__(self, item: str) -> Any:
+        return self.resource[item]
+
+    def __repr__(self) -> str:
+        return f"LazyResource({self.name}, open={self.is_open})"
@@ -0,0 +1,403 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from pymongo import monitoring
+from pymongo.common import MAX_POOL_SIZE
+
+from scripts.config import Metrics as MetricsSettings
+
+# Seconds; spans a cached session lookup up to a slow unpaged fetch.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Tuple[str, ...], values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """
+    Monotonic counter per label set. Safe to update from driver threads.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_label_text(self.labelnames, labels)} {value}"
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram per label set. Safe to update from driver threads.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            series = [
+                (labels, list(counts), total)
+                for labels, (counts, total) in self._series.items()
+            ]
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                label_text = _label_text(self.labelnames, labels, f'le="{bound}"')
+                yield f"{self.name}_bucket{label_text} {cumulative}"
+            label_text = _label_text(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {total}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    Process-local metrics rendered in the Prometheus text exposition format.
+    Counters and histograms are updated on the hot path; gauges are read from
+    collector callbacks only when /metrics is scraped.
+    """
+
+    def __init__(self, enabled: bool = MetricsSettings.METRICS_ENABLED):
+        self.enabled = enabled
+        self._metrics: List = []
+        self._collectors: List[Tuple[str, str, Tuple[str, ...], Callable]] = []
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        metric = Counter(name, documentation, tuple(labelnames))
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames=()) -> Histogram:
+        metric = Histogram(name, documentation, tuple(labelnames))
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...],
+        collect: Callable[[], Iterable[Tuple[Labels, float]]],
+    ) -> None:
+        """
+        Registers a gauge whose (labels, value) pairs are read at scrape time.
+        """
+        self._collectors.append((name, documentation, tuple(labelnames), collect))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for name, documentation, labelnames, collect in self._collectors:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in collect():
+                lines.append(f"{name}{_label_text(labelnames, labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_requests = metrics.counter(
+    "http_requests_total",
+    "HTTP requests by route and status.",
+    ("method", "route", "status"),
+)
+http_latency = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route"),
+)
+mongo_latency = metrics.histogram(
+    "mongo_command_duration_seconds", "Mongo command latency.", ("command",)
+)
+mongo_failures = metrics.counter(
+    "mongo_command_failures_total", "Failed Mongo commands.", ("command",)
+)
+mongo_checkout_latency = metrics.histogram(
+    "mongo_pool_checkout_duration_seconds", "Wait for a pooled Mongo connection."
+)
+mongo_checkout_failures = metrics.counter(
+    "mongo_pool_checkout_failures_total",
+    "Mongo connection checkouts that failed.",
+    ("reason",),
+)
+redis_latency = metrics.histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency, pipelines as one.",
+    ("command",),
+)
+redis_failures = metrics.counter(
+    "redis_command_failures_total", "Failed Redis commands.", ("command",)
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing every HTTP request. The route label is the matched
+    route template, so path parameters do not create new series; requests that
+    match no route share the "unmatched" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            return await self.app(scope, receive, send)
+        status = "500"
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            http_latency.observe(time.perf_counter() - start, method, path)
+            http_requests.inc(method, path, status)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    pymongo command listener feeding per-command latency. Runs on the thread
+    that executed the command, so it only records, it never blocks.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        mongo_latency.observe(event.duration_micros / 1e6, event.command_name)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        mongo_latency.observe(event.duration_micros / 1e6, event.command_name)
+        mongo_failures.inc(event.command_name)
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    pymongo pool listener tracking checkout waits and connections in use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_use: Dict[str, int] = {}
+        self.max_size: Dict[str, int] = {}
+
+    def _address(self, event) -> str:
+        host, port = event.address
+        return f"{host}:{port}"
+
+    def _add(self, event, delta: int) -> None:
+        address = self._address(event)
+        with self._lock:
+            self.in_use[address] = self.in_use.get(address, 0) + delta
+
+    def pool_created(self, event) -> None:
+        # Only non-default options are reported.
+        with self._lock:
+            self.max_size[self._address(event)] = event.options.get(
+                "maxPoolSize", MAX_POOL_SIZE
+            )
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        with self._lock:
+            self.in_use.pop(self._address(event), None)
+            self.max_size.pop(self._address(event), None)
+
+    def connection_created(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        pass
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    def connection_check_out_failed(self, event) -> None:
+        mongo_checkout_failures.inc(str(event.reason))
+
+    def connection_checked_out(self, event) -> None:
+        if metrics.enabled:
+            mongo_checkout_latency.observe(getattr(event, "duration", 0) or 0)
+        self._add(event, 1)
+
+    def connection_checked_in(self, event) -> None:
+        self._add(event, -1)
+
+    def usage(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Connections in use and the pool size, per server address.
+        """
+        with self._lock:
+            in_use = dict(self.in_use)
+            max_size = dict(self.max_size)
+        return {
+            address: (in_use.get(address, 0), max_size.get(address, 0))
+            for address in in_use.keys() | max_size.keys()
+        }
+
+    def collect(self) -> Iterable[Tuple[Labels, float]]:
+        for address, (in_use, max_size) in self.usage().items():
+            yield (address, "in_use"), in_use
+            yield (address, "max"), max_size
+
+
+def mongo_event_listeners() -> list:
+    """
+    Listeners to pass to a Mongo client. Pool usage is always tracked, the
+    readiness probe reports it; command timings only with metrics enabled.
+    """
+    if not metrics.enabled:
+        return [mongo_pool_metrics]
+    return [MongoCommandMetrics(), mongo_pool_metrics]
+
+
+mongo_pool_metrics = MongoPoolMetrics()
+metrics.gauge(
+    "mongo_pool_connections",
+    "Mongo pool connections in use and the pool size.",
+    ("address", "state"),
+    mongo_pool_metrics.collect,
+)
+
+
+def observe_redis(command: str, started: float, failed: bool = False) -> None:
+    redis_latency.observe(time.perf_counter() - started, command)
+    if failed:
+        redis_failures.inc(command)
+
+
+_redis_pools: Dict[str, object] = {}
+
+
+def track_redis_pool(name: str, pool) -> None:
+    """
+    Reports the connections in use and idle of a redis-py asyncio pool.
+    """
+    _redis_pools[name] = pool
+
+
+def redis_pool_usage(pool) -> Tuple[int, int, int]:
+    """
+    Connections in use, idle connections and the size of a redis-py asyncio pool.
+    """
+    return (
+        len(getattr(pool, "_in_use_connections", ())),
+        len(getattr(pool, "_available_connections", ())),
+        pool.max_connections,
+    )
+
+
+def _collect_redis_pools() -> Iterable[Tuple[Labels, float]]:
+    for name, pool in _redis_pools.items():
+        in_use, idle, max_size = redis_pool_usage(pool)
+        yield (name, "in_use"), in_use
+        yield (name, "idle"), idle
+        yield (name, "max"), max_size
+
+
+metrics.gauge(
+    "redis_pool_connections",
+    "Redis pool connections in use, idle and the pool size.",
+    ("pool", "state"),
+    _collect_redis_pools,
+)
+
+
+def stats_gauges(
+    name: str, documentation: str, sources: Dict[str, Callable[[], dict]]
+) -> None:
+    """
+    Exposes the numeric fields of `stats()` callables as one gauge labelled by
+    source and field, e.g. cache hit ratios.
+    """
+
+    def collect() -> Iterable[Tuple[Labels, float]]:
+        for source, stats in sources.items():
+            for field, value in stats().items():
+                if isinstance(value, (int, float)):
+                    yield (source, field), value
+
+    metrics.gauge(name, documentation, ("source", "field"), collect)
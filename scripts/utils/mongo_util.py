@@ -1,18 +1,54 @@
+import asyncio
+import base64
+import json
 import re
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from pymongo import MongoClient
+import bson
+import orjson
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import BulkWriteError
 
+from scripts.config import Mongo
 from scripts.config.constants import QueryConstants
-from scripts.core.schemas.task_model import FetchTaskModel
-from scripts.exceptions.module_exception import MongoException
+from scripts.core.schemas.task_model import FetchTaskModel, TaskPageModel
+from scripts.exceptions.module_exception import CustomError, MongoException
+from scripts.utils.metrics_util import mongo_event_listeners
+
+
+def pool_options() -> Dict:
+    """
+    Connection pool and timeout options of the Mongo clients, from the settings.
+    A socket timeout of 0 keeps the driver default of no timeout.
+    """
+    return {
+        "maxPoolSize": Mongo.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": Mongo.MONGO_MIN_POOL_SIZE,
+        "waitQueueTimeoutMS": Mongo.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "connectTimeoutMS": Mongo.MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": Mongo.MONGO_SOCKET_TIMEOUT_MS or None,
+        "serverSelectionTimeoutMS": Mongo.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "event_listeners": mongo_event_listeners(),
+    }
+
+
+async def warm_up(client, connections: int) -> None:
+    """
+    Selects a server and opens `connections` pooled connections with concurrent
+    pings, so the first requests of a worker do not pay for either.
+    """
+    await asyncio.gather(
+        *(client.admin.command("ping") for _ in range(max(connections, 1)))
+    )
 
 
 class MongoConnect:
     def __init__(self, uri):
         try:
             self.uri = uri
-            self.client = MongoClient(self.uri, connect=False)
+            self.client = MongoClient(self.uri, connect=False, **pool_options())
         except Exception as e:
             raise MongoException(f"exception in insert function function as {e}") from e
 
@@ -195,56 +231,569 @@ class MongoCollectionBaseClass:
             raise MongoException(f"exception in aggregate function as {e}") from e
 
 
+class AsyncMongoConnect:
+    def __init__(self, uri):
+        try:
+            self.uri = uri
+            self.client = AsyncIOMotorClient(self.uri, **pool_options())
+        except Exception as e:
+            raise MongoException(f"exception in insert function function as {e}") from e
+
+    def __call__(self, *args, **kwargs):
+        return self.client
+
+    def __repr__(self):
+        return f"Async Mongo Client(uri:{self.uri})"
+
+
+class AsyncMongoCollectionBaseClass:
+    """
+    Awaitable counterpart of MongoCollectionBaseClass backed by motor.
+    `find` and `aggregate` return motor cursors which are consumed with
+    `async for` or `await cursor.to_list(length=None)`.
+    """
+
+    def __init__(self, mongo_client, database, collection):
+        self.client = mongo_client
+        self.database = database
+        self.collection = collection
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(database={self.database}, collection={self.collection})"
+
+    async def insert_one(self, data: Dict):
+        """
+        The function is used to inserting a document to a collection in a Mongo Database.
+        :param data: Data to be inserted
+        :return: Insert ID
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.insert_one(data)
+            return response.inserted_id
+        except Exception as e:
+            raise MongoException(f"exception in insert function function as {e}") from e
+
+    async def insert_many(self, data: List, ordered: bool = True):
+        """
+        The function is used to inserting documents to a collection in a Mongo Database.
+        :param data: List of Data to be inserted
+        :param ordered: Stop at the first failed insert if True
+        :return: Insert IDs
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.insert_many(data, ordered=ordered)
+            return response.inserted_ids
+        except Exception as e:
+            raise MongoException(f"exception in insert many function as {e}") from e
+
+    async def bulk_write(self, operations: List, ordered: bool = False) -> Dict:
+        """
+        The function is used to send a batch of write operations in one round trip.
+        Per-operation failures do not raise, they are reported in the result.
+        :param operations: pymongo write operations (InsertOne, UpdateOne, ...)
+        :param ordered: Stop at the first failed operation if True
+        :return: Bulk API result with nInserted, nMatched, nModified and writeErrors
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.bulk_write(operations, ordered=ordered)
+            return response.bulk_api_result
+        except BulkWriteError as e:
+            return e.details
+        except Exception as e:
+            raise MongoException(f"exception in bulk write function as {e}") from e
+
+    def find(
+        self,
+        query: Dict,
+        filter_dict: Optional[Dict] = None,
+        sort=None,
+        skip: Optional[int] = 0,
+        limit: Optional[int] = None,
+        raw_batches: bool = False,
+    ):
+        """
+        The function is used to query documents from a given collection in a Mongo Database
+        :param query: Query Dictionary
+        :param filter_dict: Filter Dictionary
+        :param sort: List of tuple with key and direction. [(key, -1), ...]
+        :param skip: Skip Number
+        :param limit: Limit Number
+        :param raw_batches: Yield undecoded BSON batches, see raw_batches_to_json
+        :return: Async cursor over the matched documents
+        """
+        if sort is None:
+            sort = []
+        if filter_dict is None:
+            filter_dict = {"_id": 0}
+        database_name = self.database
+        collection_name = self.collection
+        try:
+            db = self.client[database_name]
+            collection = db[collection_name]
+            find = collection.find_raw_batches if raw_batches else collection.find
+            if len(sort) > 0:
+                cursor = find(query, filter_dict).sort(sort).skip(skip)
+            else:
+                cursor = find(query, filter_dict).skip(skip)
+            if limit:
+                cursor = cursor.limit(limit)
+            return cursor
+        except Exception as e:
+            raise MongoException(f"exception in mongo connection as {e}") from e
+
+    async def find_one(self, query: Dict, filter_dict: Optional[Dict] = None):
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            if filter_dict is None:
+                filter_dict = {"_id": 0}
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.find_one(query, filter_dict)
+            return response or {}
+        except Exception as e:
+            raise MongoException(f"exception  in find function as {e}") from e
+
+    async def update_one(self, query: Dict, data: Dict, upsert: bool = False):
+        """
+        :param upsert:
+        :param query:
+        :param data:
+        :return:
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            if "$set" in data:
+                data = data["$set"]
+            response = await collection.update_one(query, {"$set": data}, upsert=upsert)
+            return response.modified_count
+        except Exception as e:
+            raise MongoException(f"exception  in update function as {e}") from e
+
+    async def find_one_and_update(
+        self,
+        query: Dict,
+        update: Dict,
+        filter_dict: Optional[Dict] = None,
+        return_updated: bool = False,
+    ):
+        """
+        Atomically applies an update document and returns the matched document.
+        :param query: Filter of the document to update
+        :param update: Update document with its operators ($set, $inc, ...)
+        :param filter_dict: Projection of the returned document
+        :param return_updated: Return the document after the update instead of before
+        :return: The matched document, {} if nothing matched
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            if filter_dict is None:
+                filter_dict = {"_id": 0}
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.find_one_and_update(
+                query,
+                update,
+                projection=filter_dict,
+                return_document=(
+                    ReturnDocument.AFTER if return_updated else ReturnDocument.BEFORE
+                ),
+            )
+            return response or {}
+        except Exception as e:
+            raise MongoException(
+                f"exception  in find one and update function as {e}"
+            ) from e
+
+    async def update_many(self, query: Dict, data: Dict, upsert: bool = False):
+        """
+
+        :param upsert:
+        :param query:
+        :param data:
+        :return:
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            if "$set" in data:
+                data = data["$set"]
+            response = await collection.update_many(
+                query, {"$set": data}, upsert=upsert
+            )
+            return response.modified_count
+        except Exception as e:
+            raise MongoException(f"exception in aggregate function as {e}") from e
+
+    async def delete_many(self, query: Dict):
+        """
+        :param query:
+        :return:
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.delete_many(query)
+            return response.deleted_count
+        except Exception as e:
+            raise MongoException(f"exception  in connecting {e}") from e
+
+    async def delete_one(self, query: Dict):
+        """
+        :param query:
+        :return:
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            response = await collection.delete_one(query)
+            return response.deleted_count
+        except Exception as e:
+            raise MongoException(
+                f"exception  in delete function of mongo as {e}"
+            ) from e
+
+    def aggregate(
+        self,
+        pipelines: List,
+        batch_size: Optional[int] = None,
+        raw_batches: bool = False,
+    ):
+        """
+        :param pipelines: Aggregation pipeline
+        :param batch_size: Number of documents per cursor batch, driver default if None
+        :param raw_batches: Yield undecoded BSON batches, see raw_batches_to_json
+        :return: Async command cursor over the results
+        """
+        try:
+            database_name = self.database
+            collection_name = self.collection
+            db = self.client[database_name]
+            collection = db[collection_name]
+            aggregate = (
+                collection.aggregate_raw_batches
+                if raw_batches
+                else collection.aggregate
+            )
+            if batch_size:
+                return aggregate(pipelines, batchSize=batch_size)
+            return aggregate(pipelines)
+        except Exception as e:
+            raise MongoException(f"exception in aggregate function as {e}") from e
+
+
+async def raw_batches_to_json(cursor) -> bytes:
+    """
+    Converts a raw batch cursor to a JSON array one batch at a time: each batch
+    is decoded by the driver's C extension and encoded by orjson right away, so
+    decoded documents only live for one batch and the result is serialised once.
+
+    Args:
+        cursor: Cursor returned by find/aggregate with raw_batches=True.
+
+    Returns:
+        bytes: JSON array of the documents, in cursor order.
+    """
+    parts = []
+    async for batch in cursor:
+        if documents := bson.decode_all(batch):
+            # Strip the brackets so batches join into a single array.
+            parts.append(orjson.dumps(documents, default=str)[1:-1])
+    return b"[" + b",".join(parts) + b"]"
+
+
+class QueryPlan(NamedTuple):
+    """
+    Compiled, immutable translation of a filter/sort *shape*. Only the literal
+    filter values are bound per request.
+    """
+
+    filters: Tuple[Tuple[str, str, str], ...]
+    sort: Tuple[Tuple[str, int], ...]
+
+
+def _bind_contains(value):
+    return {QueryConstants.regex: re.escape(value), QueryConstants.options: "i"}
+
+
+def _bind_not_contains(value):
+    return {"$not": re.compile(value, re.IGNORECASE)}
+
+
+def _bind_equals(value):
+    return value
+
+
+def _bind_not_equal(value):
+    return {"$ne": value}
+
+
+def _bind_starts_with(value):
+    return {QueryConstants.regex: f"^{value}", QueryConstants.options: "i"}
+
+
+def _bind_ends_with(value):
+    return {QueryConstants.regex: f"{value}$", QueryConstants.options: "i"}
+
+
+FILTER_BINDERS = {
+    "contains": _bind_contains,
+    "notContains": _bind_not_contains,
+    "equals": _bind_equals,
+    "notEqual": _bind_not_equal,
+    "startsWith": _bind_starts_with,
+    "endsWith": _bind_ends_with,
+}
+
+# JSON scalars a keyset cursor may carry, one per sort key
+CURSOR_VALUE_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=QueryConstants.plan_cache_size)
+def compile_plan(
+    filter_shape: Tuple[Tuple[str, str], ...],
+    sort_shape: Tuple[Tuple[str, str], ...],
+    paginated: bool = False,
+    searching: bool = False,
+) -> QueryPlan:
+    """
+    Compiles a filter/sort shape into a QueryPlan. Results are kept in a bounded
+    LRU so grids that keep sending the same shape skip the translation.
+
+    Args:
+        filter_shape: (column, filter type) pairs of the filterModel.
+        sort_shape: (column, direction) pairs of the sortModel.
+        paginated: Whether the task_id tiebreaker is appended to the sort.
+        searching: Whether results are ranked by text score first.
+
+    Returns:
+        QueryPlan: Mongo keys and filter types, and the Mongo sort keys.
+    """
+    key_mongo_mapping = QueryConstants.key_mongo_mapping
+    filters = tuple(
+        (column, key_mongo_mapping.get(column, column), filter_type or "contains")
+        for column, filter_type in filter_shape
+    )
+    sort = {QueryConstants.search_score_key: -1} if searching else {}
+    for column, direction in sort_shape:
+        if direction in ("asc", "desc"):
+            sort[key_mongo_mapping.get(column, column)] = (
+                1 if direction == "asc" else -1
+            )
+    if paginated:
+        sort.setdefault(QueryConstants.tiebreaker_key, 1)
+    return QueryPlan(filters=filters, sort=tuple(sort.items()))
+
+
 class MongoQueryBuilder:
     def add_filters(self, query, input_data: FetchTaskModel) -> list:
-        sort = {}
-        if input_data.filters.sortModel:
-            key_mongo_mapping = QueryConstants.key_mongo_mapping
-            for each_sort in input_data.filters.sortModel:
-                each_sort["colId"] = key_mongo_mapping.get(
-                    each_sort["colId"], each_sort["colId"]
-                )
-                if each_sort["sort"] == "desc":
-                    sort[each_sort["colId"]] = -1
-                elif each_sort["sort"] == "asc":
-                    sort[each_sort["colId"]] = 1
-            sort = {"$sort": sort}
+        plan = self.compile(input_data)
+        sort = dict(plan.sort)
+        search = input_data.filters.search
         if input_data.filters.filterModel:
-            query_to_search = self.query_builder(
-                filter_dict=input_data.filters.filterModel
+            query[0][QueryConstants.match].update(
+                self.bind_filters(plan, input_data.filters.filterModel)
             )
-            query[0][QueryConstants.match].update(query_to_search)
-        if sort:
-            query.append(sort)
+        if search:
+            query[0][QueryConstants.match][QueryConstants.text] = {
+                QueryConstants.search: search
+            }
+            query.append(
+                {
+                    QueryConstants.add_fields: {
+                        QueryConstants.search_score_key: {"$meta": "textScore"}
+                    }
+                }
+            )
+        if input_data.page_size:
+            if input_data.cursor:
+                seek = self.seek_query(
+                    sort=sort, values=self.decode_cursor(input_data.cursor, sort)
+                )
+                if search:
+                    # The text score only exists after $addFields.
+                    query.append({QueryConstants.match: seek})
+                else:
+                    query[0][QueryConstants.match].setdefault(
+                        QueryConstants.and_, []
+                    ).append(seek)
+            query.append({QueryConstants.sort: sort})
+            query.append({QueryConstants.limit: input_data.page_size + 1})
+        elif sort:
+            query.append({QueryConstants.sort: sort})
         return query
 
-    def query_builder(self, filter_dict: dict):
+    @staticmethod
+    def compile(input_data: FetchTaskModel) -> QueryPlan:
+        """
+        Extracts the shape of the request's filterModel and sortModel, without
+        their values, and returns the cached QueryPlan for it.
+
+        Args:
+            input_data: The fetch request.
+
+        Returns:
+            QueryPlan: The compiled plan for the request's shape.
+        """
+        filter_shape = tuple(
+            (column, value.get("type", ""))
+            for column, value in (input_data.filters.filterModel or {}).items()
+        )
+        sort_shape = tuple(
+            (each_sort["colId"], each_sort["sort"])
+            for each_sort in input_data.filters.sortModel or []
+        )
+        return compile_plan(
+            filter_shape,
+            sort_shape,
+            bool(input_data.page_size),
+            bool(input_data.filters.search),
+        )
+
+    @staticmethod
+    def bind_filters(plan: QueryPlan, filter_dict: dict) -> dict:
+        """
+        Binds the filter values of a request to a compiled plan.
+
+        Args:
+            plan: Compiled plan of the request's shape.
+            filter_dict: The AG-Grid filterModel holding the values.
+
+        Returns:
+            dict: Match conditions keyed by Mongo field.
+        """
         _query = {}
-        for _key, _value in filter_dict.items():
-            condition = self.form_search_query(_value=_value)
-            _query = self.update_query_to_dict(
-                query_dict=condition, _key=_key, _value=_value, _query=_query
+        for column, mongo_key, filter_type in plan.filters:
+            binder = FILTER_BINDERS.get(filter_type)
+            _query[mongo_key] = (
+                binder(filter_dict[column].get("filter")) if binder else None
             )
         return _query
 
+    def sort_spec(self, input_data: FetchTaskModel) -> dict:
+        """
+        Translates the AG-Grid sortModel into a Mongo sort document. Paginated
+        requests always end with task_id so the sort order is total.
+
+        Args:
+            input_data: The fetch request.
+
+        Returns:
+            dict: Mongo sort keys mapped to 1 / -1.
+        """
+        return dict(self.compile(input_data).sort)
+
     @staticmethod
-    def update_query_to_dict(query_dict, _query, _key="", _value=Any):
+    def seek_query(sort: dict, values: list) -> dict:
         """
-        Updates a query dictionary based on the provided key, value, and conditions.
+        Builds the range predicate that resumes a keyset scan after the row
+        holding `values`, e.g. for sort {a: 1, task_id: 1}:
+        {$or: [{a: {$gt: va}}, {a: va, task_id: {$gt: vt}}]}
+
+        Null and missing values sort before every other value, and $gt / $lt
+        never compare across types, so they are handled explicitly: ascending
+        after a null every non-null value follows, descending after a value
+        the nulls follow, and nothing follows a null descending.
 
         Args:
-            query_dict: The query dictionary to update.
-            _key: The key to update in the query dictionary.
-            _query: existing query
-            _value: The value associated with the key.
+            sort: Mongo sort document of the page.
+            values: Sort key values of the last row of the previous page.
 
         Returns:
-            dict: The updated query dictionary based on the provided key, value, and conditions.
+            dict: Match expression selecting the rows after that row.
         """
-        key_mongo_mapping = QueryConstants.key_mongo_mapping
-        _key = key_mongo_mapping.get(_key, _key)
-        _query[_key] = query_dict
-        return _query
+        branches = []
+        equals = {}
+        for (key, direction), value in zip(sort.items(), values):
+            if value is None:
+                if direction == 1:
+                    branches.append(equals | {key: {QueryConstants.ne: None}})
+            else:
+                operator = QueryConstants.gt if direction == 1 else QueryConstants.lt
+                branches.append(equals | {key: {operator: value}})
+                if direction == -1:
+                    branches.append(equals | {key: None})
+            equals = equals | {key: value}
+        return {QueryConstants.or_: branches}
+
+    @staticmethod
+    def encode_cursor(sort: dict, document: dict) -> str:
+        """
+        Encodes the sort key values of a row into an opaque continuation cursor.
+        """
+        values = []
+        for key in sort:
+            value = document
+            for part in key.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            values.append(value)
+        payload = json.dumps([list(sort.items()), values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str, sort: dict) -> list:
+        """
+        Decodes a continuation cursor, rejecting cursors issued for another sort order.
+        Cursors come back from the client unsigned: the values end up in a match
+        expression, so only one scalar per sort key is accepted.
+
+        Raises:
+            CustomError: If the cursor is malformed or does not match the sort.
+        """
+        try:
+            sort_items, values = json.loads(base64.urlsafe_b64decode(cursor))
+            sort_items = [tuple(item) for item in sort_items]
+        except Exception as e:
+            raise CustomError("Invalid cursor !!") from e
+        if sort_items != list(sort.items()):
+            raise CustomError("Cursor does not match the requested sort !!")
+        if (
+            not isinstance(values, list)
+            or len(values) != len(sort)
+            or not all(isinstance(value, CURSOR_VALUE_TYPES) for value in values)
+        ):
+            raise CustomError("Invalid cursor !!")
+        return values
+
+    def paginate(self, records: list, input_data: FetchTaskModel) -> TaskPageModel:
+        """
+        Trims the look-ahead row fetched by add_filters and builds the next cursor.
+        """
+        if len(records) <= input_data.page_size:
+            return TaskPageModel(records=records)
+        records = records[: input_data.page_size]
+        return TaskPageModel(
+            records=records,
+            next_cursor=self.encode_cursor(self.sort_spec(input_data), records[-1]),
+        )
+
+    def query_builder(self, filter_dict: dict):
+        filter_shape = tuple(
+            (column, value.get("type", "")) for column, value in filter_dict.items()
+        )
+        return self.bind_filters(compile_plan(filter_shape, ()), filter_dict)
 
     @staticmethod
     def form_search_query(_value):
@@ -257,22 +806,5 @@ class MongoQueryBuilder:
         Returns:
             dict: A dictionary representing the search query based on the provided value.
         """
-        search_value = _value["type"] if _value.get("type", "") else "contains"
-        search_value_mapper = {
-            "contains": {
-                QueryConstants.regex: re.escape(_value.get("filter")),
-                QueryConstants.options: "i",
-            },
-            "notContains": {"$not": re.compile(_value.get("filter"), re.IGNORECASE)},
-            "equals": _value.get("filter"),
-            "notEqual": {"$ne": _value.get("filter")},
-            "startsWith": {
-                QueryConstants.regex: f'^{_value.get("filter")}',
-                QueryConstants.options: "i",
-            },
-            "endsWith": {
-                QueryConstants.regex: f'{_value.get("filter")}$',
-                QueryConstants.options: "i",
-            },
-        }
-        return search_value_mapper.get(search_value)
+        binder = FILTER_BINDERS.get(_value.get("type", "") or "contains")
+        return binder(_value.get("filter")) if binder else None
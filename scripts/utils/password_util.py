@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+from scripts.config import Hashing
+from scripts.exceptions.messages import ErrorMessages
+from scripts.exceptions.module_exception import PoolSaturatedError
+
+
+def _hash_password(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _check_password(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification on a bounded worker pool so the
+    CPU-heavy key stretching never executes on the event loop thread.
+    Once `queue_depth` jobs are pending, new jobs are rejected with
+    PoolSaturatedError instead of queueing without bound.
+    """
+
+    def __init__(
+        self,
+        pool_type: str = Hashing.HASH_POOL_TYPE,
+        workers: int = Hashing.HASH_POOL_WORKERS,
+        queue_depth: int = Hashing.HASH_QUEUE_DEPTH,
+        rounds: int = Hashing.BCRYPT_ROUNDS,
+    ):
+        self.pool_type = pool_type
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.rounds = rounds
+        self._executor: Executor | None = None
+        self._pending = 0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(pool_type={self.pool_type}, workers={self.workers}, "
+            f"queue_depth={self.queue_depth}, pending={self._pending})"
+        )
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.pool_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bcrypt"
+                )
+        return self._executor
+
+    async def _submit(self, func, *args):
+        if self._pending >= self.queue_depth:
+            raise PoolSaturatedError(ErrorMessages.ERROR004)
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> bytes:
+        """
+        Hashes a password with the configured bcrypt cost factor.
+        Args:
+            password: Plain text password.
+        Returns:
+            bytes: bcrypt hash of the password.
+        Raises:
+            PoolSaturatedError: If the hashing queue is full.
+        """
+        return await self._submit(_hash_password, password.encode("utf-8"), self.rounds)
+
+    async def verify(self, password: str, hashed_password: bytes) -> bool:
+        """
+        Checks a password against a stored bcrypt hash.
+        Args:
+            password: Plain text password.
+            hashed_password: Stored bcrypt hash.
+        Returns:
+            bool: True if the password matches.
+        Raises:
+            PoolSaturatedError: If the hashing queue is full.
+        """
+        return await self._submit(
+            _check_password, password.encode("utf-8"), hashed_password
+        )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {"pending": self._pending, "queue_depth": self.queue_depth}
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,137 @@
+import json
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Tuple
+
+from scripts.config import Principal as PrincipalSettings
+from scripts.config.constants import RedisChannels
+from scripts.core.db.redis import login_db
+from scripts.logging import logger
+from scripts.utils.cache_util import TTLCache
+from scripts.utils.pubsub_util import ChannelListener
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    user_id: str
+    user_role: str
+    group_ids: Tuple[str, ...]
+
+    @property
+    def is_admin(self) -> bool:
+        return self.user_role == "admin"
+
+    @property
+    def scope(self) -> list:
+        """
+        Assignees whose tasks the principal may see: its groups and itself.
+        """
+        return [*self.group_ids, self.user_id]
+
+
+class PrincipalCache:
+    """
+    Two level cache of user_id -> (role, group_ids): a bounded per-worker LRU in
+    front of a Redis copy shared by all workers. Every entry carries the time it
+    was loaded from Mongo and is never served past `ttl` seconds after that, so
+    a role change made outside update_user_info is picked up within `ttl`.
+    update_user_info invalidates explicitly, on every worker, through pub/sub.
+    """
+
+    key_prefix = "principal:"
+
+    def __init__(
+        self,
+        maxsize: int = PrincipalSettings.PRINCIPAL_CACHE_SIZE,
+        ttl: float = PrincipalSettings.PRINCIPAL_CACHE_TTL_SECS,
+        channel: str = RedisChannels.principal_invalidation,
+    ):
+        self.ttl = ttl
+        self.channel = channel
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._listener = ChannelListener(
+            channel, on_message=self._cache.pop, on_reset=self._cache.clear
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.maxsize > 0 and self.ttl > 0
+
+    async def get(
+        self, user_id: str, loader: Callable[[], Awaitable[dict]]
+    ) -> Principal:
+        """
+        Resolves a user's role and groups, loading them from Mongo on a miss.
+        Args:
+            user_id: The user to resolve.
+            loader: Coroutine function returning the user document.
+        Returns:
+            Principal: Role and group ids of the user.
+        """
+        if not self.enabled:
+            return self._from_document(user_id, await loader())
+        if principal := self._cache.get(user_id):
+            return principal
+        try:
+            if cached := await login_db.get(f"{self.key_prefix}{user_id}"):
+                data = json.loads(cached)
+                principal = Principal(user_id, data["role"], tuple(data["groups"]))
+                self._cache.set(user_id, principal, ttl=self._remaining(data["at"]))
+                return principal
+        except Exception as e:
+            logger.exception(f"Failed to read cached principal : {str(e)}")
+        loaded_at = time.time()
+        principal = self._from_document(user_id, await loader())
+        self._cache.set(user_id, principal)
+        try:
+            await login_db.set(
+                f"{self.key_prefix}{user_id}",
+                json.dumps(
+                    {
+                        "role": principal.user_role,
+                        "groups": principal.group_ids,
+                        "at": loaded_at,
+                    }
+                ),
+                px=int(self.ttl * 1000),
+            )
+        except Exception as e:
+            logger.exception(f"Failed to share cached principal : {str(e)}")
+        return principal
+
+    async def invalidate(self, user_id: str) -> None:
+        """
+        Drops a user's cached principal from Redis and from every worker.
+        """
+        self._cache.pop(user_id)
+        try:
+            await login_db.delete(f"{self.key_prefix}{user_id}")
+            await login_db.publish(self.channel, user_id)
+        except Exception as e:
+            logger.exception(f"Failed to invalidate principal : {str(e)}")
+
+    def _remaining(self, loaded_at: float) -> float:
+        return self.ttl - (time.time() - loaded_at)
+
+    @staticmethod
+    def _from_document(user_id: str, document: dict) -> Principal:
+        document = document or {}
+        return Principal(
+            user_id=user_id,
+            user_role=(document.get("user_role") or "").lower(),
+            group_ids=tuple(document.get("group_ids") or []),
+        )
+
+    def start_listener(self) -> None:
+        if self.enabled:
+            self._listener.start()
+
+    async def stop_listener(self) -> None:
+        await self._listener.stop()
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,54 @@
+import asyncio
+from typing import Callable, Optional
+
+from scripts.core.db.redis import login_db
+from scripts.logging import logger
+
+
+class ChannelListener:
+    """
+    Background task that hands every message published on a Redis channel to a
+    callback. The subscription is re-established after connection errors, and
+    `on_reset` is called since messages sent meanwhile may have been missed.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_message: Callable[[str], None],
+        on_reset: Optional[Callable[[], None]] = None,
+    ):
+        self.channel = channel
+        self.on_message = on_message
+        self.on_reset = on_reset
+        self._task: Optional[asyncio.Task] = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = login_db.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    self.on_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.on_reset:
+                    self.on_reset()
+                logger.exception(f"Listener on {self.channel} failed : {str(e)}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
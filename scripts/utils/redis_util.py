@@ -1,4 +1,45 @@
+import time
+
 import redis
+import redis.asyncio
+from redis.asyncio.client import Pipeline
+
+from scripts.utils.metrics_util import metrics, observe_redis, track_redis_pool
+
+
+class InstrumentedRedis(redis.asyncio.Redis):
+    """
+    Asyncio Redis client recording the latency of every command, and of every
+    pipeline as a whole, in the metrics registry.
+    """
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            response = await super().execute_command(*args, **options)
+        except Exception:
+            observe_redis(str(args[0]), started, failed=True)
+            raise
+        observe_redis(str(args[0]), started)
+        return response
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> Pipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        command = "MULTI" if self.is_transaction else "PIPELINE"
+        started = time.perf_counter()
+        try:
+            response = await super().execute(raise_on_error=raise_on_error)
+        except Exception:
+            observe_redis(command, started, failed=True)
+            raise
+        observe_redis(command, started)
+        return response
 
 
 class RedisConnector:
@@ -17,3 +58,34 @@ class RedisConnector:
         return redis.from_url(
             url=self.redis_uri, db=db, decode_responses=decoded_response
         )
+
+    def connect_async(
+        self,
+        db: int,
+        max_connections: int,
+        pool_timeout: float,
+        decoded_response: bool = True,
+    ) -> redis.asyncio.Redis:
+        """
+        Creates an asyncio Redis client on an explicitly sized connection pool.
+        Callers wait up to pool_timeout seconds for a free connection instead of
+        opening connections without bound.
+        Args:
+            db: Integer representing the database number to connect to.
+            max_connections: Maximum number of connections in the pool.
+            pool_timeout: Seconds to wait for a free connection before failing.
+            decoded_response: Boolean indicating whether responses should be decoded (default True).
+        Returns:
+            redis.asyncio.Redis: Asyncio Redis connection object.
+        """
+        pool = redis.asyncio.BlockingConnectionPool.from_url(
+            url=self.redis_uri,
+            db=db,
+            decode_responses=decoded_response,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+        )
+        if not metrics.enabled:
+            return redis.asyncio.Redis(connection_pool=pool)
+        track_redis_pool(f"db{db}", pool)
+        return InstrumentedRedis(connection_pool=pool)
@@ -0,0 +1,94 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+import orjson
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from scripts.core.schemas import DefaultResponseSchema
+
+_SUB_RESPONSE = "_envelope_sub_response"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    # ObjectId, Decimal128 and other BSON types.
+    return str(value)
+
+
+class ORJSONEnvelopeResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONEnvelopeRoute(APIRoute):
+    """
+    Route class that serialises the `{status, message, data}` envelope straight
+    to bytes with orjson, skipping FastAPI's jsonable_encoder walk over every
+    document in `data`. Select it per router with
+    `APIRouter(route_class=ORJSONEnvelopeRoute)`.
+
+    Only endpoints returning a DefaultResponseSchema are affected; Response
+    objects pass through as is. Headers, cookies and status code set on the
+    injected Response (e.g. by CookieAuthentication) are carried over. The
+    envelope is not validated against a response_model, so routes of such a
+    router should not declare one.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, self._envelope(endpoint), **kwargs)
+
+    def _envelope(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        # include_router builds the route again from the already wrapped endpoint.
+        if not inspect.iscoroutinefunction(endpoint):
+            return endpoint
+        if hasattr(endpoint, _SUB_RESPONSE):
+            return endpoint
+
+        signature = inspect.signature(endpoint)
+        # FastAPI injects a single Response parameter, reuse the endpoint's own.
+        response_param = next(
+            (
+                name
+                for name, param in signature.parameters.items()
+                if inspect.isclass(param.annotation)
+                and issubclass(param.annotation, Response)
+            ),
+            None,
+        )
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if response_param:
+                sub_response: Response = kwargs[response_param]
+            else:
+                sub_response = kwargs.pop(_SUB_RESPONSE)
+            content = await endpoint(*args, **kwargs)
+            if not isinstance(content, DefaultResponseSchema):
+                return content
+            response = ORJSONEnvelopeResponse(
+                # Shallow field dict: documents in data are left to orjson.
+                dict(content),
+                status_code=sub_response.status_code or self.status_code or 200,
+            )
+            response.headers.raw.extend(sub_response.headers.raw)
+            return response
+
+        setattr(wrapper, _SUB_RESPONSE, True)
+        if not response_param:
+            wrapper.__signature__ = signature.replace(
+                parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter(
+                        _SUB_RESPONSE,
+                        inspect.Parameter.KEYWORD_ONLY,
+                        annotation=Response,
+                    ),
+                ]
+            )
+        return wrapper
@@ -0,0 +1,147 @@
+import hashlib
+import re
+import time
+import uuid
+from typing import Iterable, List, Optional
+
+import orjson
+
+from scripts.config import ResultCache as ResultCacheSettings
+from scripts.core.db.redis import login_db
+from scripts.logging import logger
+from scripts.utils.cache_util import SizedLRUCache
+
+
+def _encode_pattern(value):
+    if isinstance(value, re.Pattern):
+        return f"re:{value.flags}:{value.pattern}"
+    raise TypeError
+
+
+class ResultCache:
+    """
+    Per-worker cache of task fetch results keyed by the normalized aggregate
+    pipeline plus the write generations of every assignee the view can see.
+
+    Task writes bump the generation of each affected assignee (and a global
+    generation read by unscoped admin views), so only views that could contain
+    the written task get a new key; other cached views stay valid. Generations
+    are random tokens rather than counters: one lost to a Redis restart, flush
+    or eviction is replaced by a new token, never by a value an earlier key
+    was built from.
+    """
+
+    generation_prefix = "task_gen:"
+    all_scope = "*"
+
+    def __init__(
+        self,
+        max_bytes: int = ResultCacheSettings.RESULT_CACHE_MAX_BYTES,
+        max_entry_bytes: int = ResultCacheSettings.RESULT_CACHE_MAX_ENTRY_BYTES,
+        ttl: float = ResultCacheSettings.RESULT_CACHE_TTL_SECS,
+    ):
+        self._cache = SizedLRUCache(
+            max_bytes=max_bytes, max_entry_bytes=max_entry_bytes, ttl=ttl
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.max_bytes > 0 and self._cache.ttl > 0
+
+    def _generation_keys(self, scope: Optional[List[str]]) -> List[str]:
+        members = [self.all_scope] if scope is None else sorted(set(scope))
+        return [f"{self.generation_prefix}{member}" for member in members]
+
+    async def key_for(
+        self, pipeline: list, scope: Optional[List[str]]
+    ) -> Optional[str]:
+        """
+        Builds the cache key of a fetch. Must be called before running the
+        query, so that a write racing with the query invalidates its result.
+        Args:
+            pipeline: The aggregate pipeline of the fetch.
+            scope: Assignees visible to the caller, None for unscoped admin views.
+        Returns:
+            Optional[str]: Cache key, or None if caching is disabled or unavailable.
+        """
+        if not self.enabled:
+            return None
+        keys = self._generation_keys(scope)
+        try:
+            generations = await login_db.mget(keys)
+            if None in generations:
+                await self._initialise(
+                    [key for key, value in zip(keys, generations) if value is None]
+                )
+                generations = await login_db.mget(keys)
+        except Exception as e:
+            logger.exception(f"Failed to read task generations : {str(e)}")
+            return None
+        if None in generations:
+            return None
+        # Key order is kept as is: it is significant in $sort stages.
+        digest = hashlib.sha1(orjson.dumps(pipeline, default=_encode_pattern))
+        digest.update(orjson.dumps(generations))
+        return digest.hexdigest()
+
+    def entity_tag(self, key: str) -> str:
+        """
+        Entity tag of the view cached under `key`. Writes made outside the API
+        bump no generation, so the tag also changes every RESULT_CACHE_TTL_SECS
+        and a client revalidates at most one window past the cached result.
+        """
+        window = int(time.time() // self._cache.ttl)
+        return f'"{key}-{window}"'
+
+    @staticmethod
+    def _token() -> str:
+        return uuid.uuid4().hex
+
+    async def _initialise(self, keys: List[str]) -> None:
+        # NX keeps a token another worker set meanwhile.
+        async with login_db.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, self._token(), nx=True)
+            await pipe.execute()
+
+    def get(self, key: Optional[str]) -> Optional[list]:
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        return None if cached is None else orjson.loads(cached)
+
+    def set(self, key: Optional[str], result: list) -> None:
+        if key is not None:
+            self._cache.set(key, orjson.dumps(result, default=str))
+
+    def get_json(self, key: Optional[str]) -> Optional[bytes]:
+        """
+        Returns the cached result as the JSON array it is stored as.
+        """
+        return None if key is None else self._cache.get(key)
+
+    def set_json(self, key: Optional[str], result: bytes) -> None:
+        if key is not None:
+            self._cache.set(key, result)
+
+    async def bump(self, assignees: Iterable[str]) -> None:
+        """
+        Invalidates every cached view that could contain tasks of these assignees.
+        """
+        if not self.enabled:
+            return
+        try:
+            async with login_db.pipeline(transaction=False) as pipe:
+                for member in {self.all_scope, *assignees}:
+                    pipe.set(f"{self.generation_prefix}{member}", self._token())
+                await pipe.execute()
+        except Exception as e:
+            # Other workers fall back on the TTL, this one at least drops its views.
+            self._cache.clear()
+            logger.exception(f"Failed to bump task generations : {str(e)}")
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+result_cache = ResultCache()
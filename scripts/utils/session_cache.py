@@ -0,0 +1,95 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from scripts.config import Session
+from scripts.config.constants import RedisChannels
+from scripts.logging import logger
+from scripts.utils.cache_util import TTLCache
+from scripts.utils.pubsub_util import ChannelListener
+from scripts.utils.session_store import session_store
+
+
+@dataclass(slots=True)
+class CachedSession:
+    user_id: str
+    expires_at: float
+    last_active: int
+
+
+class SessionCache:
+    """
+    Per-worker cache of already validated login sessions keyed by login token.
+    Logout and token refresh publish the login token on a Redis channel so
+    every worker drops its copy.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = Session.SESSION_CACHE_SIZE,
+        ttl: float = Session.SESSION_CACHE_TTL_SECS,
+        channel: str = RedisChannels.session_invalidation,
+    ):
+        self.channel = channel
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._listener = ChannelListener(
+            channel, on_message=self._cache.pop, on_reset=self._cache.clear
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.maxsize > 0 and self._cache.ttl > 0
+
+    def get(self, login_token: str) -> Optional[CachedSession]:
+        if not self.enabled:
+            return None
+        return self._cache.get(login_token)
+
+    def set(self, login_token: str, user_id: str, expires_at: float, last_active: int):
+        """
+        Caches a validated session until the earlier of the cache TTL and expires_at.
+        Args:
+            login_token: Login token of the session.
+            user_id: User the session belongs to.
+            expires_at: Epoch seconds at which the access token expires.
+            last_active: Last activity of the session in epoch milliseconds.
+        """
+        if not self.enabled:
+            return
+        self._cache.set(
+            login_token,
+            CachedSession(
+                user_id=user_id, expires_at=expires_at, last_active=last_active
+            ),
+            ttl=expires_at - time.time(),
+        )
+
+    def discard(self, login_token: str) -> None:
+        self._cache.pop(login_token)
+
+    async def invalidate(self, login_token: str) -> None:
+        """
+        Drops a session from this worker and asks every other worker to do the same.
+        """
+        self._cache.pop(login_token)
+        try:
+            await session_store.publish(self.channel, login_token)
+        except Exception as e:
+            logger.exception(f"Failed to publish session invalidation : {str(e)}")
+
+    def start_listener(self) -> None:
+        """
+        Subscribes to the invalidation channel on a background task.
+        """
+        if self.enabled:
+            self._listener.start()
+
+    async def stop_listener(self) -> None:
+        await self._listener.stop()
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+session_cache = SessionCache()
@@ -0,0 +1,73 @@
+from datetime import timedelta
+from typing import Dict
+
+from scripts.core.db.redis import login_db
+
+# Only touch sessions that still exist and never move last_active backwards,
+# so a late flush cannot resurrect a logged out session or undo a newer write
+# from another worker.
+_SET_LAST_ACTIVE = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local current = redis.call('HGET', KEYS[1], 'last_active')
+if current and tonumber(current) >= tonumber(ARGV[1]) then
+    return 0
+end
+return redis.call('HSET', KEYS[1], 'last_active', ARGV[1])
+"""
+
+
+class SessionStore:
+    """
+    Awaitable access to the login sessions kept in Redis, one hash per login token.
+    """
+
+    def __init__(self, redis_client=login_db):
+        self.redis = redis_client
+        self._set_last_active = None
+
+    async def create(self, login_token: str, mapping: Dict, ttl: timedelta) -> None:
+        """
+        Writes a session and its expiry in a single MULTI/EXEC round trip.
+        Args:
+            login_token: Login token of the session.
+            mapping: Session fields (tokens and last_active).
+            ttl: Time until the session expires.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(login_token, mapping=mapping)
+            pipe.expire(login_token, ttl)
+            await pipe.execute()
+
+    async def get(self, login_token: str) -> Dict:
+        return await self.redis.hgetall(login_token)
+
+    async def exists(self, login_token: str) -> bool:
+        return bool(login_token) and bool(await self.redis.exists(login_token))
+
+    async def delete(self, login_token: str) -> None:
+        if login_token:
+            await self.redis.delete(login_token)
+
+    async def touch_many(self, last_active: Dict[str, int]) -> None:
+        """
+        Refreshes last_active of many sessions in one pipelined round trip.
+        Args:
+            last_active: Activity time in epoch milliseconds keyed by login token.
+        """
+        if self._set_last_active is None:
+            # Registered on first use, so importing this module opens no pool.
+            self._set_last_active = self.redis.register_script(_SET_LAST_ACTIVE)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for login_token, value in last_active.items():
+                await self._set_last_active(
+                    keys=[login_token], args=[value], client=pipe
+                )
+            await pipe.execute()
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self.redis.publish(channel, message)
+
+
+session_store = SessionStore()
@@ -0,0 +1,198 @@
+import asyncio
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Set
+
+import orjson
+from starlette.websockets import WebSocket
+
+from scripts.config import Principal as PrincipalSettings
+from scripts.config import TaskEvents as TaskEventsSettings
+from scripts.config.constants import RedisChannels
+from scripts.core.db.redis import login_db
+from scripts.logging import logger
+from scripts.utils.principal_cache import Principal
+from scripts.utils.pubsub_util import ChannelListener
+
+# Closed with "try again later" when a subscriber cannot keep up; the client
+# re-fetches and subscribes again.
+WS_TRY_AGAIN_LATER = 1013
+# Closed when the session ended or the subscriber's scope changed; the client
+# subscribes again to get its new scope, or is rejected.
+WS_POLICY_VIOLATION = 1008
+_RESYNC = orjson.dumps({"type": "resync"}).decode()
+
+
+class Subscriber:
+    __slots__ = ("principal", "queue")
+
+    def __init__(self, principal: Principal, queue_size: int):
+        self.principal = principal
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Drop the backlog and tell the pump to disconnect the client.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class TaskEventHub:
+    """
+    Per-worker fan-out of task change events to websocket subscribers.
+
+    Writers publish events on one Redis channel so every worker sees every
+    change; each worker holds a single subscription and routes an event only to
+    the subscribers whose scope contains one of the task's assignees (admins get
+    everything). Idle subscribers cost a bounded queue and three parked
+    coroutines. The scope is resolved when subscribing and re-checked every
+    `revalidate_secs`, never longer than the principal cache TTL: a socket whose
+    session ended or whose role or groups changed is closed.
+    """
+
+    def __init__(
+        self,
+        channel: str = RedisChannels.task_events,
+        queue_size: int = TaskEventsSettings.SUBSCRIBER_QUEUE_SIZE,
+        revalidate_secs: float = TaskEventsSettings.REVALIDATE_INTERVAL_SECS,
+    ):
+        self.channel = channel
+        self.queue_size = queue_size
+        if PrincipalSettings.PRINCIPAL_CACHE_TTL_SECS > 0:
+            revalidate_secs = min(
+                revalidate_secs, PrincipalSettings.PRINCIPAL_CACHE_TTL_SECS
+            )
+        self.revalidate_secs = revalidate_secs
+        self._by_assignee: Dict[str, Set[Subscriber]] = defaultdict(set)
+        self._admins: Set[Subscriber] = set()
+        self._listener = ChannelListener(
+            channel, on_message=self._dispatch, on_reset=self._resync
+        )
+
+    async def publish(self, events: List[dict]) -> None:
+        """
+        Publishes the events of one write to every worker. Failures are logged,
+        subscribers then miss the change until their next fetch.
+        """
+        if not events:
+            return
+        try:
+            await login_db.publish(self.channel, orjson.dumps(events, default=str))
+        except Exception as e:
+            logger.exception(f"Failed to publish task events : {str(e)}")
+
+    def subscribe(self, principal: Principal) -> Subscriber:
+        subscriber = Subscriber(principal, self.queue_size)
+        if principal.is_admin:
+            self._admins.add(subscriber)
+        else:
+            for member in principal.scope:
+                self._by_assignee[member].add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._admins.discard(subscriber)
+        for member in subscriber.principal.scope:
+            if subscribers := self._by_assignee.get(member):
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._by_assignee[member]
+
+    def _dispatch(self, data: str) -> None:
+        try:
+            events = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring malformed task event on {self.channel}")
+            return
+        for event in events:
+            targets = set(self._admins)
+            for assignee in event.get("assignees", []):
+                targets.update(self._by_assignee.get(assignee, ()))
+            if targets:
+                message = orjson.dumps(event).decode()
+                for subscriber in targets:
+                    subscriber.offer(message)
+
+    def _resync(self) -> None:
+        # Events may have been lost while the subscription was down.
+        for subscriber in self._subscribers():
+            subscriber.offer(_RESYNC)
+
+    def _subscribers(self) -> Set[Subscriber]:
+        return self._admins.union(*self._by_assignee.values())
+
+    async def serve(
+        self,
+        websocket: WebSocket,
+        principal: Principal,
+        revalidate: Callable[[], Awaitable[Principal]],
+    ) -> None:
+        """
+        Streams the events visible to the principal to an accepted websocket
+        until either side disconnects. Messages from the client are ignored.
+        Args:
+            websocket: The accepted websocket.
+            principal: The subscriber's role and groups when subscribing.
+            revalidate: Re-authenticates the websocket and resolves its principal
+                again, raising if the session is no longer valid.
+        """
+        subscriber = self.subscribe(principal)
+        tasks = {
+            asyncio.create_task(self._pump(websocket, subscriber)),
+            asyncio.create_task(self._read_until_disconnect(websocket)),
+            asyncio.create_task(self._revalidate(websocket, principal, revalidate)),
+        }
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.unsubscribe(subscriber)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _revalidate(
+        self,
+        websocket: WebSocket,
+        principal: Principal,
+        revalidate: Callable[[], Awaitable[Principal]],
+    ) -> None:
+        while True:
+            await asyncio.sleep(self.revalidate_secs)
+            try:
+                current = await revalidate()
+            except Exception as e:
+                reason = str(e)
+                break
+            if current != principal:
+                reason = "scope changed"
+                break
+        logger.info(f"Closing task subscription of {principal.user_id} : {reason}")
+        await websocket.close(code=WS_POLICY_VIOLATION)
+
+    @staticmethod
+    async def _pump(websocket: WebSocket, subscriber: Subscriber) -> None:
+        while (message := await subscriber.queue.get()) is not None:
+            await websocket.send_text(message)
+        await websocket.close(code=WS_TRY_AGAIN_LATER)
+
+    @staticmethod
+    async def _read_until_disconnect(websocket: WebSocket) -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    def start_listener(self) -> None:
+        self._listener.start()
+
+    async def stop_listener(self) -> None:
+        await self._listener.stop()
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers()),
+            "assignees": len(self._by_assignee),
+        }
+
+
+task_event_hub = TaskEventHub()
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "tests.log"))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from scripts.config import Mongo  # noqa: E402
+from scripts.core.db.mongo.indexes import (  # noqa: E402
+    ensure_indexes,
+    explain_hot_queries,
+)
+
+
+class TestHotQueriesUseIndexes(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncIOMotorClient(Mongo.MONGO_URI, serverSelectionTimeoutMS=2000)
+        try:
+            await self.client.admin.command("ping")
+        except Exception:
+            self.client.close()
+            self.skipTest("MONGO_URI is unreachable")
+
+    async def asyncTearDown(self):
+        self.client.close()
+
+    async def test_no_collscan_in_winning_plans(self):
+        await ensure_indexes(self.client)
+        self.assertEqual(await explain_hot_queries(self.client), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import base64
+import json
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "tests.log"))
+
+from scripts.exceptions.module_exception import CustomError  # noqa: E402
+from scripts.utils.mongo_util import MongoQueryBuilder  # noqa: E402
+
+try:
+    import mongomock
+except ImportError:
+    mongomock = None
+
+SORT = {"description": 1, "task_id": 1}
+
+
+def _cursor(sort_items, values) -> str:
+    payload = json.dumps([sort_items, values])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+@unittest.skipIf(mongomock is None, "needs mongomock")
+class TestSeekOverNulls(unittest.TestCase):
+    def setUp(self):
+        self.tasks = mongomock.MongoClient().task_manager.tasks
+        self.tasks.insert_many(
+            [
+                {"task_id": f"t{i}", "description": None if i % 2 else f"d{i}"}
+                for i in range(6)
+            ]
+        )
+        self.tasks.insert_one({"task_id": "t6"})
+
+    def _page_through(self, sort: dict, page_size: int = 2) -> list:
+        seen, values = [], None
+        while True:
+            query = {} if values is None else MongoQueryBuilder.seek_query(sort, values)
+            page = list(
+                self.tasks.find(query, {"_id": 0})
+                .sort(list(sort.items()))
+                .limit(page_size)
+            )
+            if not page:
+                return seen
+            seen += [task["task_id"] for task in page]
+            cursor = MongoQueryBuilder.encode_cursor(sort, page[-1])
+            values = MongoQueryBuilder.decode_cursor(cursor, sort)
+
+    def _sorted(self, sort: dict) -> list:
+        return [
+            task["task_id"]
+            for task in self.tasks.find({}, {"_id": 0}).sort(list(sort.items()))
+        ]
+
+    def test_ascending_crosses_from_nulls_to_values(self):
+        self.assertEqual(self._page_through(SORT), self._sorted(SORT))
+
+    def test_descending_crosses_from_values_to_nulls(self):
+        sort = {"description": -1, "task_id": 1}
+        self.assertEqual(self._page_through(sort), self._sorted(sort))
+
+
+class TestDecodeCursor(unittest.TestCase):
+    def test_round_trip(self):
+        cursor = MongoQueryBuilder.encode_cursor(SORT, {"task_id": "t1"})
+        self.assertEqual(MongoQueryBuilder.decode_cursor(cursor, SORT), [None, "t1"])
+
+    def test_rejects_operator_values(self):
+        cursor = _cursor(list(SORT.items()), [{"$ne": None}, "t1"])
+        with self.assertRaises(CustomError):
+            MongoQueryBuilder.decode_cursor(cursor, SORT)
+
+    def test_rejects_value_count_mismatch(self):
+        cursor = _cursor(list(SORT.items()), ["d1"])
+        with self.assertRaises(CustomError):
+            MongoQueryBuilder.decode_cursor(cursor, SORT)
+
+    def test_rejects_other_sort(self):
+        cursor = _cursor([["title", 1], ["task_id", 1]], ["a", "t1"])
+        with self.assertRaises(CustomError):
+            MongoQueryBuilder.decode_cursor(cursor, SORT)
+
+
+if __name__ == "__main__":
+    unittest.main()
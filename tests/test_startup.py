@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "tests.log"))
+
+from benchmarks.startup import BUDGET_MS, check, run  # noqa: E402
+
+STUB_MODULES = ("mongomock_motor", "fakeredis", "httpx")
+
+
+@unittest.skipIf(
+    any(importlib.util.find_spec(name) is None for name in STUB_MODULES),
+    "needs the stub backend (mongomock-motor, fakeredis, httpx)",
+)
+class TestStartupBudget(unittest.TestCase):
+    def test_stub_startup_within_budget(self):
+        report = run(runs=3, backend="stub", timeout=10)
+        self.assertEqual(report["side_effects"], [])
+        self.assertEqual(check(report, BUDGET_MS), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+os.environ.setdefault("LOG_FILE", os.path.join(tempfile.gettempdir(), "tests.log"))
+
+from fastapi import HTTPException, status  # noqa: E402
+
+from scripts.utils.principal_cache import Principal  # noqa: E402
+from scripts.utils.task_events import WS_POLICY_VIOLATION, TaskEventHub  # noqa: E402
+
+USER = Principal(user_id="user_1", user_role="user", group_ids=("group_1",))
+
+
+class _WebSocket:
+    def __init__(self):
+        self.sent = []
+        self.close_code = None
+        self._closed = asyncio.Event()
+
+    async def send_text(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def receive(self) -> dict:
+        await self._closed.wait()
+        return {"type": "websocket.disconnect"}
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+        self._closed.set()
+
+
+class TestSubscriptionRevalidation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.hub = TaskEventHub(revalidate_secs=0.01)
+        self.websocket = _WebSocket()
+
+    async def _serve(self, revalidate):
+        await asyncio.wait_for(
+            self.hub.serve(self.websocket, USER, revalidate=revalidate), timeout=1
+        )
+
+    async def test_closes_when_session_ends(self):
+        async def revalidate():
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+        await self._serve(revalidate)
+        self.assertEqual(self.websocket.close_code, WS_POLICY_VIOLATION)
+        self.assertEqual(self.hub.stats()["subscribers"], 0)
+
+    async def test_closes_when_scope_changes(self):
+        async def revalidate():
+            return Principal(user_id="user_1", user_role="user", group_ids=())
+
+        await self._serve(revalidate)
+        self.assertEqual(self.websocket.close_code, WS_POLICY_VIOLATION)
+        self.assertEqual(self.hub.stats(), {"subscribers": 0, "assignees": 0})
+
+    async def test_closes_when_admin_is_demoted(self):
+        admin = Principal(user_id="user_1", user_role="admin", group_ids=())
+
+        async def revalidate():
+            return USER
+
+        await asyncio.wait_for(
+            self.hub.serve(self.websocket, admin, revalidate=revalidate), timeout=1
+        )
+        self.assertEqual(self.websocket.close_code, WS_POLICY_VIOLATION)
+        self.assertEqual(self.hub.stats()["subscribers"], 0)
+
+    async def test_keeps_valid_subscription_open(self):
+        async def revalidate():
+            return USER
+
+        serving = asyncio.create_task(
+            self.hub.serve(self.websocket, USER, revalidate=revalidate)
+        )
+        await asyncio.sleep(0.1)
+        self.assertIsNone(self.websocket.close_code)
+        self.hub._dispatch('[{"type": "created", "assignees": ["group_1"]}]')
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.websocket.sent), 1)
+        await self.websocket.close()
+        await asyncio.wait_for(serving, timeout=1)
+        self.assertEqual(self.hub.stats()["subscribers"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()